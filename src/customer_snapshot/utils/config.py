@@ -3,15 +3,85 @@ Configuration management for Customer Snapshot Generator.
 """
 
 import os
+import sys
+from collections.abc import Callable, Mapping
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, ClassVar, Optional
 
 from dotenv import load_dotenv
 
 
+# Repository root (four levels above this file), resolved once at import
+_BASE_DIR = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+_DATA_DIR = os.path.join(_BASE_DIR, "data")
+
+# Values accepted as "true" for boolean environment flags
+_TRUTHY = frozenset({"1", "true", "yes", "on", "t", "y"})
+
+
+# Environment variables read by Config, captured once per instance
+_ENV_VARS = (
+    "ANTHROPIC_API_KEY",
+    "VOYAGEAI_API_KEY",
+    "TAVILY_API_KEY",
+    "DEFAULT_MODEL",
+    "MAX_TOKENS",
+    "TEMPERATURE",
+    "MAX_FILE_SIZE",
+    "ALLOWED_EXTENSIONS",
+    "CHUNK_SIZE",
+    "CHUNK_OVERLAP",
+    "LOG_LEVEL",
+    "DEBUG",
+    "ENABLE_FILE_VALIDATION",
+    "SANITIZE_FILENAMES",
+    "SPACY_MODEL",
+    "MIN_ENTITY_FREQUENCY",
+    "MIN_ENTITY_LENGTH",
+    "ENABLE_MEMORY_MONITORING",
+    "MEMORY_LIMIT_MB",
+    "STREAMING_THRESHOLD_MB",
+    "GC_FREQUENCY",
+    "ENABLE_MEMORY_PROFILING",
+)
+
+
+def _envbool(env: Mapping[str, str], name: str, default: str) -> bool:
+    """Read a boolean flag from an environment snapshot."""
+    return env.get(name, default).strip().lower() in _TRUTHY
+
+
+def _envint(env: Mapping[str, str], name: str, default: str) -> int:
+    """Read an integer from an environment snapshot, naming the variable on error."""
+    value = env.get(name, default)
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {value!r}") from None
+
+
+# Instances handed out by Config.get_default()/from_env_file(), keyed by env file
+_CONFIG_CACHE: dict[Optional[str], "Config"] = {}
+
+
 class Config:
     """Application configuration with secure defaults."""
 
+    # (attribute, predicate, message) checked by validate()
+    _VALIDATION_RULES: ClassVar[tuple[tuple[str, Callable[[Any], bool], str], ...]] = (
+        ("anthropic_api_key", bool, "ANTHROPIC_API_KEY is required"),
+        ("max_tokens", lambda v: v > 0, "MAX_TOKENS must be positive"),
+        ("temperature", lambda v: 0 <= v <= 1, "TEMPERATURE must be between 0 and 1"),
+        ("max_file_size", lambda v: v > 0, "MAX_FILE_SIZE must be positive"),
+    )
+
+    # Data directories already created in this process
+    _initialized_dirs: ClassVar[set[Path]] = set()
+
     def __init__(self, env_file: Optional[str] = None):
         """
         Initialize configuration.
@@ -26,127 +96,197 @@ class Config:
             load_dotenv()
 
         # Base directories
-        self.base_dir = Path(__file__).parent.parent.parent.parent
-        self.src_dir = self.base_dir / "src"
-        self.data_dir = self.base_dir / "data"
-        self.input_dir = self.data_dir / "input"
-        self.output_dir = self.data_dir / "output"
-        self.templates_dir = self.data_dir / "templates"
+        self.base_dir = Path(_BASE_DIR)
+        self.src_dir = Path(os.path.join(_BASE_DIR, "src"))
+        self.data_dir = Path(_DATA_DIR)
+        self.input_dir = Path(os.path.join(_DATA_DIR, "input"))
+        self.output_dir = Path(os.path.join(_DATA_DIR, "output"))
+        self.templates_dir = Path(os.path.join(_DATA_DIR, "templates"))
+
+        # Create directories if they don't exist (once per process)
+        if self.data_dir not in Config._initialized_dirs:
+            self._ensure_directories()
+            Config._initialized_dirs.add(self.data_dir)
 
-        # Create directories if they don't exist
-        self._ensure_directories()
+        # Snapshot the variables Config reads, so settings parsed later (see
+        # the cached properties below) see the same values as __init__
+        getenv = os.environ.get
+        env = self._env = {
+            name: value for name in _ENV_VARS if (value := getenv(name)) is not None
+        }
 
         # API Keys
-        self.anthropic_api_key: Optional[str] = os.getenv("ANTHROPIC_API_KEY")
-        self.voyage_api_key: Optional[str] = os.getenv("VOYAGEAI_API_KEY")
-        self.tavily_api_key: Optional[str] = os.getenv("TAVILY_API_KEY")
+        self.anthropic_api_key: Optional[str] = env.get("ANTHROPIC_API_KEY")
+        self.voyage_api_key: Optional[str] = env.get("VOYAGEAI_API_KEY")
+        self.tavily_api_key: Optional[str] = env.get("TAVILY_API_KEY")
 
         # Model settings
-        self.default_model = os.getenv("DEFAULT_MODEL", "claude-sonnet-4-5-20250929")
-        self.max_tokens = int(os.getenv("MAX_TOKENS", "4000"))
-        self.temperature = float(os.getenv("TEMPERATURE", "0.0"))
-
-        # File processing settings
-        self.max_file_size = int(
-            os.getenv("MAX_FILE_SIZE", str(50 * 1024 * 1024))
-        )  # 50MB
-        self.allowed_extensions = os.getenv(
-            "ALLOWED_EXTENSIONS", ".vtt,.txt,.md"
-        ).split(",")
-        self.chunk_size = int(os.getenv("CHUNK_SIZE", "500"))
-        self.chunk_overlap = int(os.getenv("CHUNK_OVERLAP", "100"))
-
-        # Logging settings
-        self.log_level = os.getenv("LOG_LEVEL", "INFO")
-        self.debug = os.getenv("DEBUG", "false").lower() == "true"
-
-        # Security settings
-        self.enable_file_validation = (
-            os.getenv("ENABLE_FILE_VALIDATION", "true").lower() == "true"
-        )
-        self.sanitize_filenames = (
-            os.getenv("SANITIZE_FILENAMES", "true").lower() == "true"
-        )
-
-        # NLP settings
-        self.spacy_model = os.getenv("SPACY_MODEL", "en_core_web_sm")
-        self.min_entity_frequency = int(os.getenv("MIN_ENTITY_FREQUENCY", "2"))
-        self.min_entity_length = int(os.getenv("MIN_ENTITY_LENGTH", "3"))
+        self.default_model = env.get("DEFAULT_MODEL", "claude-sonnet-4-5-20250929")
+        self.max_tokens = _envint(env, "MAX_TOKENS", "4000")
+        self.temperature = float(env.get("TEMPERATURE", "0.0"))
 
         # Memory optimization settings
-        self.enable_memory_monitoring = (
-            os.getenv("ENABLE_MEMORY_MONITORING", "true").lower() == "true"
+        self.enable_memory_monitoring = _envbool(
+            env, "ENABLE_MEMORY_MONITORING", "true"
         )
-        self.memory_limit_mb = int(os.getenv("MEMORY_LIMIT_MB", "1024"))  # 1GB default
-        self.streaming_threshold_mb = int(
-            os.getenv("STREAMING_THRESHOLD_MB", "10")
-        )  # 10MB threshold
-        self.gc_frequency = int(
-            os.getenv("GC_FREQUENCY", "1000")
-        )  # GC every N operations
-        self.enable_memory_profiling = (
-            os.getenv("ENABLE_MEMORY_PROFILING", "false").lower() == "true"
+        self.memory_limit_mb = _envint(env, "MEMORY_LIMIT_MB", "1024")  # 1GB default
+        # 10MB threshold
+        self.streaming_threshold_mb = _envint(env, "STREAMING_THRESHOLD_MB", "10")
+        # GC every N operations
+        self.gc_frequency = _envint(env, "GC_FREQUENCY", "1000")
+        self.enable_memory_profiling = _envbool(env, "ENABLE_MEMORY_PROFILING", "false")
+
+    # File processing, logging, security and NLP settings are parsed on first
+    # access, so callers that only need API keys or model settings skip them.
+
+    @cached_property
+    def max_file_size(self) -> int:
+        """Maximum accepted input file size in bytes (default 50MB)."""
+        return _envint(self._env, "MAX_FILE_SIZE", str(50 * 1024 * 1024))
+
+    @cached_property
+    def allowed_extensions(self) -> frozenset[str]:
+        """Lower-cased file extensions accepted for input files."""
+        return frozenset(
+            ext.strip().lower()
+            for ext in self._env.get("ALLOWED_EXTENSIONS", ".vtt,.txt,.md").split(",")
+            if ext.strip()
         )
 
+    @cached_property
+    def chunk_size(self) -> int:
+        """Text chunk size used for processing."""
+        return _envint(self._env, "CHUNK_SIZE", "500")
+
+    @cached_property
+    def chunk_overlap(self) -> int:
+        """Overlap between consecutive text chunks."""
+        return _envint(self._env, "CHUNK_OVERLAP", "100")
+
+    @cached_property
+    def log_level(self) -> str:
+        """Logging level name."""
+        return sys.intern(self._env.get("LOG_LEVEL", "INFO"))
+
+    @cached_property
+    def debug(self) -> bool:
+        """Whether debug mode is enabled."""
+        return _envbool(self._env, "DEBUG", "false")
+
+    @cached_property
+    def enable_file_validation(self) -> bool:
+        """Whether input files are validated before processing."""
+        return _envbool(self._env, "ENABLE_FILE_VALIDATION", "true")
+
+    @cached_property
+    def sanitize_filenames(self) -> bool:
+        """Whether output filenames are sanitized."""
+        return _envbool(self._env, "SANITIZE_FILENAMES", "true")
+
+    @cached_property
+    def spacy_model(self) -> str:
+        """Name of the spaCy model to load."""
+        return self._env.get("SPACY_MODEL", "en_core_web_sm")
+
+    @cached_property
+    def min_entity_frequency(self) -> int:
+        """Minimum occurrences for an entity to be reported."""
+        return _envint(self._env, "MIN_ENTITY_FREQUENCY", "2")
+
+    @cached_property
+    def min_entity_length(self) -> int:
+        """Minimum character length for an entity to be reported."""
+        return _envint(self._env, "MIN_ENTITY_LENGTH", "3")
+
     def _ensure_directories(self) -> None:
         """Create necessary directories if they don't exist."""
-        directories = [
-            self.data_dir,
-            self.input_dir,
-            self.output_dir,
-            self.templates_dir,
-        ]
+        # One scandir of data_dir tells us which leaves already exist; makedirs
+        # creates data_dir itself as needed
+        data_dir = os.fspath(self.data_dir)
+        try:
+            with os.scandir(data_dir) as entries:
+                existing = {entry.name for entry in entries if entry.is_dir()}
+        except FileNotFoundError:
+            existing = set()
 
-        for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
+        for directory in (self.input_dir, self.output_dir, self.templates_dir):
+            path = os.fspath(directory)
+            if os.path.dirname(path) == data_dir and directory.name in existing:
+                continue
+            os.makedirs(path, exist_ok=True)
 
     def validate(self) -> None:
         """Validate required configuration."""
-        errors = []
-
-        if not self.anthropic_api_key:
-            errors.append("ANTHROPIC_API_KEY is required")
+        errors = [
+            message
+            for attr, is_valid, message in self._VALIDATION_RULES
+            if not is_valid(getattr(self, attr))
+        ]
 
-        if self.max_tokens <= 0:
-            errors.append("MAX_TOKENS must be positive")
+        if errors:
+            raise ValueError(f"Configuration errors: {', '.join(errors)}")
 
-        if self.temperature < 0 or self.temperature > 1:
-            errors.append("TEMPERATURE must be between 0 and 1")
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute and drop the cached as_dict snapshot."""
+        super().__setattr__(name, value)
+        self.__dict__.pop("as_dict", None)
 
-        if self.max_file_size <= 0:
-            errors.append("MAX_FILE_SIZE must be positive")
+    @cached_property
+    def as_dict(self) -> Mapping[str, Any]:
+        """Read-only configuration snapshot (excluding sensitive data).
 
-        if errors:
-            raise ValueError(f"Configuration errors: {', '.join(errors)}")
+        Built on first access and rebuilt after any attribute is reassigned.
+        """
+        return MappingProxyType(
+            {
+                "default_model": self.default_model,
+                "max_tokens": self.max_tokens,
+                "temperature": self.temperature,
+                "max_file_size": self.max_file_size,
+                "allowed_extensions": tuple(sorted(self.allowed_extensions)),
+                "chunk_size": self.chunk_size,
+                "chunk_overlap": self.chunk_overlap,
+                "log_level": self.log_level,
+                "debug": self.debug,
+                "spacy_model": self.spacy_model,
+                "min_entity_frequency": self.min_entity_frequency,
+                "min_entity_length": self.min_entity_length,
+                "api_keys_configured": MappingProxyType(
+                    {
+                        "anthropic": bool(self.anthropic_api_key),
+                        "voyage": bool(self.voyage_api_key),
+                        "tavily": bool(self.tavily_api_key),
+                    }
+                ),
+            }
+        )
 
     def to_dict(self) -> dict[str, Any]:
         """Convert configuration to dictionary (excluding sensitive data)."""
-        return {
-            "default_model": self.default_model,
-            "max_tokens": self.max_tokens,
-            "temperature": self.temperature,
-            "max_file_size": self.max_file_size,
-            "allowed_extensions": self.allowed_extensions,
-            "chunk_size": self.chunk_size,
-            "chunk_overlap": self.chunk_overlap,
-            "log_level": self.log_level,
-            "debug": self.debug,
-            "spacy_model": self.spacy_model,
-            "min_entity_frequency": self.min_entity_frequency,
-            "min_entity_length": self.min_entity_length,
-            "api_keys_configured": {
-                "anthropic": bool(self.anthropic_api_key),
-                "voyage": bool(self.voyage_api_key),
-                "tavily": bool(self.tavily_api_key),
-            },
-        }
+        config_dict = dict(self.as_dict)
+        config_dict["allowed_extensions"] = list(config_dict["allowed_extensions"])
+        config_dict["api_keys_configured"] = dict(config_dict["api_keys_configured"])
+        return config_dict
 
     @classmethod
     def from_env_file(cls, env_file: str) -> "Config":
-        """Create configuration from specific .env file."""
-        return cls(env_file=env_file)
+        """Create configuration from specific .env file (cached per file)."""
+        return cls._cached(env_file)
 
     @classmethod
     def get_default(cls) -> "Config":
-        """Get default configuration."""
-        return cls()
+        """Get default configuration (cached)."""
+        return cls._cached(None)
+
+    @classmethod
+    def _cached(cls, env_file: Optional[str]) -> "Config":
+        """Return the shared instance for ``env_file``, building it on first use."""
+        config = _CONFIG_CACHE.get(env_file)
+        if config is None:
+            config = _CONFIG_CACHE[env_file] = cls(env_file=env_file)
+        return config
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop cached instances so the next lookup re-reads the environment."""
+        _CONFIG_CACHE.clear()
@@ -5,18 +5,19 @@ This module provides decorators, context managers, and utilities for robust
 error handling with automatic tracking and recovery mechanisms.
 """
 
+import contextvars
 import functools
 import logging
-import os
+import random
 import sys
+import threading
 import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from contextlib import contextmanager
+from dataclasses import dataclass
 from typing import Any, Callable, Optional
 
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
-
 from customer_snapshot.monitoring.error_tracker import (
     ErrorCategory,
     ErrorContext,
@@ -27,17 +28,76 @@ from customer_snapshot.monitoring.error_tracker import (
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
 class ErrorHandlingConfig:
     """Configuration for error handling behavior."""
 
-    def __init__(self):
-        self.retry_attempts = 3
-        self.retry_delay = 1.0  # seconds
-        self.retry_backoff_factor = 2.0
-        self.enable_tracking = True
-        self.raise_on_failure = True
-        self.fallback_value = None
-        self.timeout = None
+    retry_attempts: int = 3
+    retry_delay: float = 1.0  # seconds
+    retry_backoff_factor: float = 2.0
+    enable_tracking: bool = True
+    raise_on_failure: bool = True
+    fallback_value: Any = None
+    timeout: Optional[float] = None
+
+
+def _track_call_failure(
+    error: Exception, func: Callable, args: tuple, kwargs: dict, **extra_data: Any
+) -> None:
+    """Track a failed call of a decorated function along with its call shape."""
+    context = ErrorContext(
+        function_name=func.__name__,
+        module_name=func.__module__,
+        additional_data={
+            "args_count": len(args),
+            "kwargs_keys": tuple(kwargs),
+            **extra_data,
+        },
+    )
+    get_error_tracker().track_exception(error, context)
+
+
+def _backoff_delays(
+    max_attempts: int, delay: float, backoff_factor: float
+) -> tuple[float, ...]:
+    """Return the sleep before each retry: ``delay * backoff_factor**n``."""
+    return tuple(delay * backoff_factor**i for i in range(max_attempts - 1))
+
+
+def _call_with_retry(
+    func: Callable,
+    call: Callable,
+    args: tuple,
+    kwargs: dict,
+    delays: tuple[float, ...],
+    exceptions: tuple,
+    on_retry: Optional[Callable] = None,
+) -> Any:
+    """
+    Invoke ``call(*args, **kwargs)``, retrying ``exceptions`` after each delay.
+
+    Once the delays are used up the final attempt's exception propagates, as
+    does any exception not in ``exceptions``; tracking is left to the caller.
+    """
+    max_attempts = len(delays) + 1
+
+    for attempt, retry_delay in enumerate(delays):
+        try:
+            return call(*args, **kwargs)
+        except exceptions as e:
+            logger.warning(
+                f"Attempt {attempt + 1}/{max_attempts} failed for {func.__name__}: {e}"
+            )
+
+            if on_retry:
+                try:
+                    on_retry(attempt + 1, e, *args, **kwargs)
+                except Exception as callback_error:
+                    logger.error(f"Error in retry callback: {callback_error}")
+
+            time.sleep(retry_delay)
+
+    return call(*args, **kwargs)
 
 
 def with_error_tracking(
@@ -54,26 +114,16 @@ def with_error_tracking(
         reraise: Whether to re-raise the exception after tracking
     """
 
+    extra_data = context_data or {}
+
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                # Create context
-                context = ErrorContext(
-                    function_name=func.__name__,
-                    module_name=func.__module__,
-                    additional_data={
-                        "args_count": len(args),
-                        "kwargs_keys": list(kwargs.keys()),
-                        **(context_data or {}),
-                    },
-                )
-
-                # Track the error
-                error_tracker = get_error_tracker()
-                error_tracker.track_exception(e, context)
+                # The context is only built on failure
+                _track_call_failure(e, func, args, kwargs, **extra_data)
 
                 if reraise:
                     raise
@@ -104,61 +154,80 @@ def with_retry(
         on_retry: Callback function called before each retry
     """
 
+    # The delays are fixed by the arguments, so compute them once
+    delays = _backoff_delays(max_attempts, delay, backoff_factor)
+
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            last_exception = None
-            current_delay = delay
-
-            for attempt in range(max_attempts):
-                try:
-                    return func(*args, **kwargs)
-                except exceptions as e:
-                    last_exception = e
-
-                    if attempt == max_attempts - 1:  # Last attempt
-                        # Track the final failure
-                        context = ErrorContext(
-                            function_name=func.__name__,
-                            module_name=func.__module__,
-                            additional_data={
-                                "retry_attempt": attempt + 1,
-                                "max_attempts": max_attempts,
-                                "final_failure": True,
-                            },
-                        )
-                        get_error_tracker().track_exception(e, context)
-                        raise e
-
-                    # Log retry attempt
-                    logger.warning(
-                        f"Attempt {attempt + 1}/{max_attempts} failed for {func.__name__}: {e}"
-                    )
-
-                    # Call retry callback if provided
-                    if on_retry:
-                        try:
-                            on_retry(attempt + 1, e, *args, **kwargs)
-                        except Exception as callback_error:
-                            logger.error(f"Error in retry callback: {callback_error}")
-
-                    # Wait before retry
-                    if attempt < max_attempts - 1:
-                        time.sleep(current_delay)
-                        current_delay *= backoff_factor
-
-            # This should never be reached, but just in case
-            raise last_exception
+            try:
+                return _call_with_retry(
+                    func, func, args, kwargs, delays, exceptions, on_retry
+                )
+            except exceptions as e:
+                # Only the final failure is tracked
+                _track_call_failure(
+                    e,
+                    func,
+                    args,
+                    kwargs,
+                    retry_attempt=max_attempts,
+                    max_attempts=max_attempts,
+                    final_failure=True,
+                )
+                raise
 
         return wrapper
 
     return decorator
 
 
+def _call_with_timeout(
+    func: Callable, timeout_seconds: float, args: tuple, kwargs: dict
+) -> Any:
+    """Run ``func`` on a daemon thread, raising TimeoutError if it overruns."""
+    future: Future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    # A thread per call rather than a shared pool: an abandoned call must not
+    # hold a worker that other callers are waiting for, nor block exit
+    threading.Thread(
+        target=contextvars.copy_context().run,
+        args=(run,),
+        name=f"with_timeout-{func.__name__}",
+        daemon=True,
+    ).start()
+
+    try:
+        return future.result(timeout=timeout_seconds)
+    except FutureTimeoutError as e:
+        # On Python 3.11+ this is the builtin TimeoutError, so it may have
+        # been raised by func itself rather than by the wait expiring
+        if future.done() and future.exception() is e:
+            raise
+        raise TimeoutError(
+            f"Function {func.__name__} timed out after {timeout_seconds} seconds"
+        ) from None
+
+
 def with_timeout(timeout_seconds: float):
     """
     Decorator to add timeout to function execution.
 
+    Each call runs on its own daemon thread, so this works from any thread
+    (unlike SIGALRM). A call that times out is abandoned, not interrupted: it
+    keeps running in the background, so wrapped functions must tolerate that.
+    Abandoned calls do not delay other calls or interpreter exit.
+
     Args:
         timeout_seconds: Maximum execution time in seconds
     """
@@ -166,21 +235,8 @@ def with_timeout(timeout_seconds: float):
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            import signal
-
-            def timeout_handler(signum, frame):
-                raise TimeoutError(
-                    f"Function {func.__name__} timed out after {timeout_seconds} seconds"
-                )
-
-            # Set timeout signal
-            old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(int(timeout_seconds))
-
             try:
-                result = func(*args, **kwargs)
-                signal.alarm(0)  # Cancel timeout
-                return result
+                return _call_with_timeout(func, timeout_seconds, args, kwargs)
             except TimeoutError as e:
                 # Track timeout error
                 context = ErrorContext(
@@ -193,9 +249,6 @@ def with_timeout(timeout_seconds: float):
                 )
                 get_error_tracker().track_exception(e, context)
                 raise
-            finally:
-                signal.signal(signal.SIGALRM, old_handler)
-                signal.alarm(0)
 
         return wrapper
 
@@ -250,9 +303,7 @@ def error_context(context_data: dict, category: Optional[ErrorCategory] = None):
         yield
     except Exception as e:
         # Create enhanced context
-        import inspect
-
-        frame = inspect.currentframe().f_back
+        frame = sys._getframe(1)
 
         context = ErrorContext(
             function_name=frame.f_code.co_name,
@@ -298,6 +349,8 @@ def suppress_errors(exceptions: tuple = (Exception,), log_errors: bool = True):
 class ErrorBoundary:
     """Error boundary for containing and handling errors in code sections."""
 
+    __slots__ = ("errors", "fallback_value", "name", "reraise", "track_errors")
+
     def __init__(
         self,
         name: str,
@@ -315,20 +368,22 @@ class ErrorBoundary:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if exc_type is not None:
-            if self.track_errors:
-                context = ErrorContext(
-                    additional_data={
-                        "error_boundary": self.name,
-                        "boundary_type": "contained",
-                    }
-                )
-                error_record = get_error_tracker().track_exception(exc_val, context)
-                self.errors.append(error_record)
+        if exc_type is None:
+            return False
 
-            if not self.reraise:
-                logger.error(f"Error in boundary '{self.name}': {exc_val}")
-                return True  # Suppress the exception
+        if self.track_errors:
+            context = ErrorContext(
+                additional_data={
+                    "error_boundary": self.name,
+                    "boundary_type": "contained",
+                }
+            )
+            error_record = get_error_tracker().track_exception(exc_val, context)
+            self.errors.append(error_record)
+
+        if not self.reraise:
+            logger.error(f"Error in boundary '{self.name}': {exc_val}")
+            return True  # Suppress the exception
 
         return False
 
@@ -343,6 +398,10 @@ class ErrorBoundary:
         return None
 
 
+# Base retry delays (seconds) used by safe_execute; the last one repeats
+_SAFE_EXECUTE_DELAYS = (1.0, 2.0, 3.0, 4.0, 5.0)
+
+
 def safe_execute(
     func: Callable, *args, fallback_value: Any = None, retry_count: int = 0, **kwargs
 ) -> Any:
@@ -377,7 +436,12 @@ def safe_execute(
 
             if attempt < retry_count:
                 logger.warning(f"Attempt {attempt + 1} failed, retrying: {e}")
-                time.sleep(1.0 * (attempt + 1))  # Progressive delay
+                # Progressive delay with +/-20% jitter so concurrent callers
+                # don't retry in lockstep
+                base_delay = _SAFE_EXECUTE_DELAYS[
+                    min(attempt, len(_SAFE_EXECUTE_DELAYS) - 1)
+                ]
+                time.sleep(base_delay * (0.8 + 0.4 * random.random()))
             else:
                 logger.error(
                     f"All attempts failed for {func.__name__ if hasattr(func, '__name__') else 'function'}: {e}"
@@ -386,9 +450,24 @@ def safe_execute(
     return fallback_value
 
 
+# CircuitBreaker states
+_CLOSED, _OPEN, _HALF_OPEN = 0, 1, 2
+_STATE_NAMES = ("closed", "open", "half-open")
+_STATE_CODES = {name: code for code, name in enumerate(_STATE_NAMES)}
+
+
 class CircuitBreaker:
     """Circuit breaker pattern implementation for fault tolerance."""
 
+    __slots__ = (
+        "_state",
+        "expected_exception",
+        "failure_count",
+        "failure_threshold",
+        "last_failure_time",
+        "recovery_timeout",
+    )
+
     def __init__(
         self,
         failure_threshold: int = 5,
@@ -401,14 +480,36 @@ class CircuitBreaker:
 
         self.failure_count = 0
         self.last_failure_time = None
-        self.state = "closed"  # closed, open, half-open
+        self._state = _CLOSED
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half-open"."""
+        return _STATE_NAMES[self._state]
+
+    @state.setter
+    def state(self, value: str) -> None:
+        try:
+            self._state = _STATE_CODES[value]
+        except KeyError:
+            raise ValueError(f"Unknown circuit breaker state: {value!r}") from None
 
     def __call__(self, func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            if self.state == "open":
+            # Fast path: a closed breaker only needs to watch for failures
+            if self._state == _CLOSED:
+                try:
+                    result = func(*args, **kwargs)
+                except self.expected_exception as e:
+                    self._on_failure(e, func.__name__)
+                    raise
+                self.failure_count = 0
+                return result
+
+            if self._state == _OPEN:
                 if self._should_attempt_reset():
-                    self.state = "half-open"
+                    self._state = _HALF_OPEN
                 else:
                     raise Exception(f"Circuit breaker is OPEN for {func.__name__}")
 
@@ -429,7 +530,7 @@ class CircuitBreaker:
     def _on_success(self):
         """Handle successful execution."""
         self.failure_count = 0
-        self.state = "closed"
+        self._state = _CLOSED
 
     def _on_failure(self, exception: Exception, func_name: str):
         """Handle failed execution."""
@@ -437,7 +538,7 @@ class CircuitBreaker:
         self.last_failure_time = time.time()
 
         if self.failure_count >= self.failure_threshold:
-            self.state = "open"
+            self._state = _OPEN
             logger.warning(
                 f"Circuit breaker OPENED for {func_name} after {self.failure_count} failures"
             )
@@ -455,54 +556,86 @@ class CircuitBreaker:
 
 
 # Predefined error handling configurations
-STANDARD_CONFIG = ErrorHandlingConfig()
-STANDARD_CONFIG.retry_attempts = 3
-STANDARD_CONFIG.retry_delay = 1.0
+STANDARD_CONFIG = ErrorHandlingConfig(retry_attempts=3, retry_delay=1.0)
+AGGRESSIVE_RETRY_CONFIG = ErrorHandlingConfig(retry_attempts=5, retry_delay=0.5)
+NO_RETRY_CONFIG = ErrorHandlingConfig(retry_attempts=1, retry_delay=0)
+SILENT_FAIL_CONFIG = ErrorHandlingConfig(retry_attempts=1, raise_on_failure=False)
+
+
+# Common error handling patterns
+#
+# Each helper builds one wrapper that does retry, timeout and tracking inline,
+# rather than nesting with_error_tracking/with_retry/with_timeout. Besides
+# saving two wrapper frames per call, a final failure is tracked once instead
+# of once per layer.
+
+
+def _handle_with_retry(
+    func: Callable,
+    max_attempts: int = 3,
+    delay: float = 1.0,
+    backoff_factor: float = 2.0,
+    exceptions: tuple = (Exception,),
+    timeout_seconds: Optional[float] = None,
+) -> Callable:
+    """Wrap ``func`` with retry, an optional timeout and error tracking."""
+    delays = _backoff_delays(max_attempts, delay, backoff_factor)
 
-AGGRESSIVE_RETRY_CONFIG = ErrorHandlingConfig()
-AGGRESSIVE_RETRY_CONFIG.retry_attempts = 5
-AGGRESSIVE_RETRY_CONFIG.retry_delay = 0.5
+    if timeout_seconds is None:
+        call = func
+    else:
 
-NO_RETRY_CONFIG = ErrorHandlingConfig()
-NO_RETRY_CONFIG.retry_attempts = 1
-NO_RETRY_CONFIG.retry_delay = 0
+        def call(*args, **kwargs):
+            return _call_with_timeout(func, timeout_seconds, args, kwargs)
 
-SILENT_FAIL_CONFIG = ErrorHandlingConfig()
-SILENT_FAIL_CONFIG.retry_attempts = 1
-SILENT_FAIL_CONFIG.raise_on_failure = False
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return _call_with_retry(func, call, args, kwargs, delays, exceptions)
+        except exceptions as e:
+            _track_call_failure(
+                e,
+                func,
+                args,
+                kwargs,
+                retry_attempt=max_attempts,
+                max_attempts=max_attempts,
+                final_failure=True,
+            )
+            raise
+        except Exception as e:
+            # Not retryable
+            _track_call_failure(e, func, args, kwargs)
+            raise
+
+    return wrapper
 
 
-# Common error handling patterns
 def handle_file_operations(func: Callable) -> Callable:
     """Error handler specifically for file operations."""
-    return with_error_tracking(category=ErrorCategory.FILE_IO)(
-        with_retry(
-            max_attempts=3,
-            exceptions=(IOError, OSError, FileNotFoundError, PermissionError),
-        )(func)
+    return _handle_with_retry(
+        func,
+        max_attempts=3,
+        exceptions=(IOError, OSError, FileNotFoundError, PermissionError),
     )
 
 
 def handle_network_operations(func: Callable) -> Callable:
     """Error handler specifically for network operations."""
-    return with_error_tracking(category=ErrorCategory.NETWORK_ERROR)(
-        with_retry(
-            max_attempts=3, delay=2.0, exceptions=(ConnectionError, TimeoutError)
-        )(func)
+    return _handle_with_retry(
+        func, max_attempts=3, delay=2.0, exceptions=(ConnectionError, TimeoutError)
     )
 
 
 def handle_api_calls(func: Callable) -> Callable:
     """Error handler specifically for API calls."""
-    return with_error_tracking(category=ErrorCategory.API_ERROR)(
-        with_retry(max_attempts=3, delay=1.0, backoff_factor=2.0)(
-            with_timeout(30.0)(func)
-        )
+    return _handle_with_retry(
+        func, max_attempts=3, delay=1.0, backoff_factor=2.0, timeout_seconds=30.0
     )
 
 
 def handle_parsing_operations(func: Callable) -> Callable:
     """Error handler specifically for parsing operations."""
-    return with_error_tracking(category=ErrorCategory.PARSING_ERROR)(
-        with_fallback(fallback_value=None)(func)
-    )
+    # with_fallback catches every Exception, so an outer tracking layer never
+    # saw one; the fallback wrapper alone is equivalent
+    return with_fallback(fallback_value=None)(func)
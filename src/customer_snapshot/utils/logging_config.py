@@ -5,13 +5,38 @@ This module provides centralized logging configuration with security-aware
 logging practices and proper formatting.
 """
 
+import atexit
+import functools
 import logging
 import logging.handlers
+import queue
+import re
 import sys
 from pathlib import Path
 from typing import Optional, Union
 
 
+# Background thread that drains the root logger's queue; set by setup_logging
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def stop_queue_listener() -> None:
+    """
+    Flush queued log records and stop the background logging thread.
+
+    Registered to run at interpreter exit; safe to call more than once.
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+atexit.register(stop_queue_listener)
+
+
 def setup_logging(
     log_level: str = "INFO",
     log_file: Optional[Union[str, Path]] = None,
@@ -22,6 +47,11 @@ def setup_logging(
     """
     Set up comprehensive logging configuration.
 
+    The root logger only enqueues records; a background listener thread
+    sanitizes each record once, then formats and writes it with every
+    handler, so callers never block on log I/O.
+    Call stop_queue_listener() to flush it early (it also runs at exit).
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional path to log file for file logging
@@ -36,6 +66,8 @@ def setup_logging(
         >>> logger = setup_logging("DEBUG", "app.log")
         >>> logger.info("Application started")
     """
+    global _queue_listener
+
     # Convert string level to logging constant
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
 
@@ -44,6 +76,7 @@ def setup_logging(
     root_logger.setLevel(numeric_level)
 
     # Clear existing handlers to avoid duplicates
+    stop_queue_listener()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
 
@@ -54,13 +87,14 @@ def setup_logging(
             "%(filename)s:%(lineno)d - %(message)s"
         )
 
-    formatter = SecureFormatter(format_string)
+    # Records are redacted by the listener before they reach the handlers
+    formatter = logging.Formatter(format_string)
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(numeric_level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
 
     # File handler (if specified)
     if log_file:
@@ -72,7 +106,18 @@ def setup_logging(
         )
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Hand records to the real handlers on a background thread
+    log_queue: queue.Queue = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setLevel(numeric_level)
+    root_logger.addHandler(queue_handler)
+
+    _queue_listener = _RedactingQueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
 
     # Create logger for this package
     package_logger = logging.getLogger("customer_snapshot")
@@ -81,6 +126,9 @@ def setup_logging(
     return package_logger
 
 
+_DIGIT_PATTERN = re.compile(r"\d")
+
+
 class SecureFormatter(logging.Formatter):
     """
     Secure logging formatter that sanitizes sensitive information.
@@ -103,12 +151,45 @@ class SecureFormatter(logging.Formatter):
         (r"passwd[:\s=]+\S+", r"passwd=[REDACTED]"),
         # Credit card numbers (basic pattern)
         (r"\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b", r"[CREDIT_CARD_REDACTED]"),
-        # Email addresses (partial redaction)
-        (r"([a-zA-Z0-9._%+-]+)@([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})", r"\1***@\2"),
+        # Email addresses (partial redaction). A match may only start where the
+        # local part does, and the lookaheads act as atomic groups: the first
+        # captures at most 64 characters to keep, the second consumes the
+        # whole local part without backtracking. A long run of local-part
+        # characters is thus scanned once instead of once per offset, and any
+        # characters past the 64th are dropped from the output. The classes
+        # already list both cases, so case folding is switched off for speed
+        (
+            r"(?-i:(?<![a-zA-Z0-9._%+-])(?=([a-zA-Z0-9._%+-]{1,64}))"
+            r"(?=([a-zA-Z0-9._%+-]+))\2@([a-zA-Z0-9.-]{1,253}\.[a-zA-Z]{2,63}))",
+            r"\1***@\3",
+        ),
         # IP addresses (partial redaction)
         (r"\b(\d{1,3})\.\d{1,3}\.\d{1,3}\.(\d{1,3})\b", r"\1.***.***.\2"),
     ]
 
+    # Lower-case substring every match of the same-index pattern must contain,
+    # or None for the numeric patterns, which are gated on a digit instead
+    _PATTERN_SENTINELS = (
+        "key",
+        "key",
+        "key",
+        "token",
+        "bearer",
+        "password",
+        "passwd",
+        None,
+        "@",
+        None,
+    )
+
+    # (sentinel, compiled pattern, replacement), built once at class creation
+    _COMPILED_PATTERNS = tuple(
+        (sentinel, re.compile(pattern, re.IGNORECASE), replacement)
+        for sentinel, (pattern, replacement) in zip(
+            _PATTERN_SENTINELS, SENSITIVE_PATTERNS
+        )
+    )
+
     def format(self, record: logging.LogRecord) -> str:
         """
         Format log record with sensitive information redacted.
@@ -137,16 +218,43 @@ class SecureFormatter(logging.Formatter):
         Returns:
             Sanitized message with sensitive data redacted
         """
-        import re
-
+        # A substring test is far cheaper than a regex scan, and most lines
+        # contain none of the sentinels. casefold() rather than lower() so
+        # characters such as "\u017f" fold the way IGNORECASE matches them
+        lowered = message.casefold()
+        has_digit = _DIGIT_PATTERN.search(message) is not None
         sanitized = message
 
-        for pattern, replacement in self.SENSITIVE_PATTERNS:
-            sanitized = re.sub(pattern, replacement, sanitized, flags=re.IGNORECASE)
+        for sentinel, pattern, replacement in self._COMPILED_PATTERNS:
+            if has_digit if sentinel is None else sentinel in lowered:
+                sanitized = pattern.sub(replacement, sanitized)
 
         return sanitized
 
 
+class _RedactingQueueListener(logging.handlers.QueueListener):
+    """
+    Queue listener that sanitizes each record once before fanning it out.
+
+    QueueHandler.prepare has already merged the arguments and traceback text
+    into ``record.msg``, so redacting it here covers everything the handlers
+    write without a pattern pass per handler.
+    """
+
+    _formatter = SecureFormatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Redact the record's message in place and return it."""
+        record.msg = self._formatter._sanitize_message(record.getMessage())
+        record.args = None
+        return record
+
+
+def _format_context(context: dict) -> str:
+    """Render context as ``key=value`` pairs separated by `` | ``."""
+    return " | ".join(f"{k}={v}" for k, v in context.items())
+
+
 class StructuredLogger:
     """
     Structured logger for consistent logging with metadata.
@@ -165,6 +273,8 @@ class StructuredLogger:
         """
         self.logger = logging.getLogger(name)
         self.extra_context = extra_context or {}
+        # The default context is fixed, so its string is built once
+        self._extra_context_str = _format_context(self.extra_context)
 
     def _log_with_context(
         self, level: int, message: str, context: Optional[dict] = None, **kwargs
@@ -178,19 +288,26 @@ class StructuredLogger:
             context: Additional context for this message
             **kwargs: Additional keyword arguments
         """
+        # Don't build the context string for records that would be dropped
+        if not self.logger.isEnabledFor(level):
+            return
+
         # Combine default context with message-specific context
-        full_context = {**self.extra_context}
-        if context:
-            full_context.update(context)
-
-        # Format message with context
-        if full_context:
-            context_str = " | ".join(f"{k}={v}" for k, v in full_context.items())
-            formatted_message = f"{message} | {context_str}"
+        if not context:
+            context_str = self._extra_context_str
+        elif not self.extra_context.keys().isdisjoint(context):
+            # Message-specific values replace defaults with the same key
+            context_str = _format_context({**self.extra_context, **context})
+        elif self._extra_context_str:
+            context_str = f"{self._extra_context_str} | {_format_context(context)}"
         else:
-            formatted_message = message
+            context_str = _format_context(context)
 
-        self.logger.log(level, formatted_message, **kwargs)
+        # Format message with context; joining the two is left to the handler
+        if context_str:
+            self.logger.log(level, "%s | %s", message, context_str, **kwargs)
+        else:
+            self.logger.log(level, message, **kwargs)
 
     def debug(self, message: str, context: Optional[dict] = None, **kwargs) -> None:
         """Log debug message with context."""
@@ -274,23 +391,28 @@ def log_function_call(func):
         ... def process_file(filename):
         ...     return f"Processed {filename}"
     """
-    import functools
+    # Resolved once; the level check stays per call so runtime level changes
+    # still take effect
+    logger = logging.getLogger(func.__module__)
+    name = func.__name__
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        logger = logging.getLogger(func.__module__)
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
         # Log function entry (be careful with sensitive parameters)
-        logger.debug(
-            f"Calling {func.__name__} with {len(args)} args and {len(kwargs)} kwargs"
-        )
+        if debug_enabled:
+            logger.debug(
+                "Calling %s with %d args and %d kwargs", name, len(args), len(kwargs)
+            )
 
         try:
             result = func(*args, **kwargs)
-            logger.debug(f"{func.__name__} completed successfully")
+            if debug_enabled:
+                logger.debug("%s completed successfully", name)
             return result
         except Exception as e:
-            logger.error(f"{func.__name__} failed: {type(e).__name__}: {e}")
+            logger.error("%s failed: %s: %s", name, type(e).__name__, e)
             raise
 
     return wrapper
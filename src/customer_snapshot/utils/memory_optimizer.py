@@ -9,10 +9,14 @@ import functools
 import gc
 import logging
 import mmap
+import os
+import re
+import sys
 import threading
 import weakref
+from collections import OrderedDict, deque
 from collections.abc import Iterator
-from contextlib import contextmanager
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from typing import (
@@ -22,20 +26,27 @@ from typing import (
     TypeVar,
 )
 
-import psutil
+from .config import Config
 
 
-try:
-    from pympler import muppy, summary, tracker
+T = TypeVar("T")
 
-    PYMPLER_AVAILABLE = True
-except ImportError:
-    PYMPLER_AVAILABLE = False
+# Buffer size for the streaming file readers (the io default is 8 KiB)
+READ_BUFFER_SIZE = 128 * 1024
 
-from .config import Config
 
+# psutil and pympler are imported on first use rather than at module import,
+# so importing this module (and the utils package) stays cheap
 
-T = TypeVar("T")
+
+@functools.cache
+def _load_pympler_tracker() -> Any:
+    """Return pympler's tracker module, or None if pympler is not installed."""
+    try:
+        from pympler import tracker
+    except ImportError:
+        return None
+    return tracker
 
 
 @dataclass
@@ -58,21 +69,36 @@ class MemoryMetrics:
 class MemoryTracker:
     """Tracks memory usage and provides optimization insights."""
 
+    # Counting GC objects walks the whole heap, so only every Nth metrics
+    # call recounts; the calls in between reuse the last count
+    GC_OBJECTS_SAMPLE_INTERVAL = 16
+
     def __init__(self):
+        import psutil
+
         self.process = psutil.Process()
         self.baseline_memory = None
         self.peak_memory = 0
-        self.snapshots = []
         self.max_snapshots = 1000
+        # Oldest snapshots fall off the left once the history is full
+        self.snapshots: deque[dict[str, Any]] = deque(maxlen=self.max_snapshots)
+        self._metrics_count = 0
+        self._last_gc_objects = 0
 
-        if PYMPLER_AVAILABLE:
-            self.pympler_tracker = tracker.SummaryTracker()
-        else:
-            self.pympler_tracker = None
+    @functools.cached_property
+    def pympler_tracker(self) -> Any:
+        """pympler SummaryTracker, built on first access; None without pympler."""
+        tracker_module = _load_pympler_tracker()
+        return tracker_module.SummaryTracker() if tracker_module else None
 
     def get_current_metrics(self) -> MemoryMetrics:
         """Get current memory metrics."""
-        memory_info = self.process.memory_info()
+        import psutil
+
+        # oneshot() lets both process reads share a single /proc lookup
+        with self.process.oneshot():
+            memory_info = self.process.memory_info()
+            percent = self.process.memory_percent()
         system_memory = psutil.virtual_memory()
         swap_memory = psutil.swap_memory()
 
@@ -84,14 +110,17 @@ class MemoryTracker:
         # Track peak memory
         self.peak_memory = max(self.peak_memory, rss_mb)
 
-        # Count garbage collector objects
-        gc_objects = len(gc.get_objects())
+        # Count garbage collector objects (sampled, see above)
+        if self._metrics_count % self.GC_OBJECTS_SAMPLE_INTERVAL == 0:
+            self._last_gc_objects = len(gc.get_objects())
+        self._metrics_count += 1
+        gc_objects = self._last_gc_objects
 
         return MemoryMetrics(
             timestamp=datetime.now().isoformat(),
             rss_mb=rss_mb,
             vms_mb=vms_mb,
-            percent=self.process.memory_percent(),
+            percent=percent,
             available_mb=available_mb,
             swap_used_mb=swap_used_mb,
             gc_objects=gc_objects,
@@ -120,10 +149,6 @@ class MemoryTracker:
 
         self.snapshots.append(snapshot_data)
 
-        # Limit snapshot history
-        if len(self.snapshots) > self.max_snapshots:
-            self.snapshots = self.snapshots[-self.max_snapshots :]
-
         return metrics
 
     def get_memory_growth(self) -> Optional[float]:
@@ -169,56 +194,72 @@ class MemoryTracker:
         """Print formatted memory usage report."""
         analysis = self.analyze_memory_usage()
 
-        print("\n" + "=" * 50)
-        print("🧠 MEMORY USAGE ANALYSIS")
-        print("=" * 50)
+        # Collect the report and write it once instead of one print per line
+        lines = ["", "=" * 50, "🧠 MEMORY USAGE ANALYSIS", "=" * 50]
 
         if "error" in analysis:
-            print(f"❌ {analysis['error']}")
+            lines.append(f"❌ {analysis['error']}")
+            sys.stdout.write("\n".join(lines) + "\n")
             return
 
-        print(f"📊 Snapshots analyzed: {analysis['snapshots_count']}")
+        lines.append(f"📊 Snapshots analyzed: {analysis['snapshots_count']}")
 
         if analysis["baseline_memory_mb"]:
-            print(f"🏁 Baseline memory: {analysis['baseline_memory_mb']:.1f} MB")
+            lines.append(f"🏁 Baseline memory: {analysis['baseline_memory_mb']:.1f} MB")
 
-        print(f"📈 Current memory: {analysis['current_memory_mb']:.1f} MB")
-        print(f"🔺 Peak memory: {analysis['peak_memory_mb']:.1f} MB")
-        print(f"📊 Average memory: {analysis['average_memory_mb']:.1f} MB")
-        print(f"📈 Growth rate: {analysis['memory_growth_rate_mb']:.2f} MB/snapshot")
-        print(f"⚡ Memory spikes: {analysis['memory_spikes']}")
-        print(f"🗑️  GC objects: {analysis['gc_objects_current']:,}")
+        lines += [
+            f"📈 Current memory: {analysis['current_memory_mb']:.1f} MB",
+            f"🔺 Peak memory: {analysis['peak_memory_mb']:.1f} MB",
+            f"📊 Average memory: {analysis['average_memory_mb']:.1f} MB",
+            f"📈 Growth rate: {analysis['memory_growth_rate_mb']:.2f} MB/snapshot",
+            f"⚡ Memory spikes: {analysis['memory_spikes']}",
+            f"🗑️  GC objects: {analysis['gc_objects_current']:,}",
+        ]
 
         # Memory usage status
         current_mb = analysis["current_memory_mb"]
         if current_mb > 1000:
-            print("🚨 HIGH MEMORY USAGE - Consider optimization")
+            lines.append("🚨 HIGH MEMORY USAGE - Consider optimization")
         elif current_mb > 500:
-            print("⚠️  MODERATE MEMORY USAGE - Monitor closely")
+            lines.append("⚠️  MODERATE MEMORY USAGE - Monitor closely")
         else:
-            print("✅ NORMAL MEMORY USAGE")
+            lines.append("✅ NORMAL MEMORY USAGE")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 class MemoryOptimizer:
     """Provides memory optimization strategies and utilities."""
 
+    # Entries kept by cached_operation before the least recently used is evicted
+    OPERATION_CACHE_SIZE = 128
+
+    # RSS growth over a monitored operation that triggers a full collection
+    GC_GROWTH_THRESHOLD_MB = 50
+
     def __init__(self, config: Optional[Config] = None):
         self.config = config or Config.get_default()
         self.tracker = MemoryTracker()
         self._object_cache = weakref.WeakValueDictionary()
+        self._op_cache: OrderedDict[str, Any] = OrderedDict()
 
     @contextmanager
     def memory_monitoring(self, operation_name: str = "operation"):
-        """Context manager for monitoring memory during operations."""
-        self.tracker.take_snapshot(f"Before {operation_name}")
+        """
+        Context manager for monitoring memory during operations.
+
+        A full garbage collection runs afterwards only if RSS grew by more
+        than GC_GROWTH_THRESHOLD_MB during the operation.
+        """
+        before = self.tracker.take_snapshot(f"Before {operation_name}")
 
         try:
             yield self.tracker
         finally:
-            self.tracker.take_snapshot(f"After {operation_name}")
+            after = self.tracker.take_snapshot(f"After {operation_name}")
 
-            # Force garbage collection
-            self.force_garbage_collection()
+            if after.rss_mb - before.rss_mb > self.GC_GROWTH_THRESHOLD_MB:
+                self.force_garbage_collection()
 
     def force_garbage_collection(self):
         """Force garbage collection and return collected objects count."""
@@ -239,9 +280,14 @@ class MemoryOptimizer:
     def get_memory_efficient_reader(
         self, file_path: str, chunk_size: int = 8192
     ) -> Iterator[str]:
-        """Get memory-efficient file reader using chunks."""
+        """
+        Get memory-efficient file reader using chunks.
+
+        Chunks are cut at fixed character counts; use
+        get_memory_efficient_line_reader() when lines matter.
+        """
         try:
-            with open(file_path, encoding="utf-8", buffering=chunk_size) as f:
+            with open(file_path, encoding="utf-8", buffering=READ_BUFFER_SIZE) as f:
                 while True:
                     chunk = f.read(chunk_size)
                     if not chunk:
@@ -251,33 +297,89 @@ class MemoryOptimizer:
             logging.error(f"Error reading file {file_path}: {e}")
             raise
 
-    def get_mmap_reader(self, file_path: str) -> Iterator[bytes]:
-        """Get memory-mapped file reader for large files."""
+    def get_memory_efficient_line_reader(self, file_path: str) -> Iterator[str]:
+        """
+        Get memory-efficient file reader that yields one line at a time.
+
+        Lines keep their trailing newline; reads go through a
+        READ_BUFFER_SIZE buffer, so only that much of the file is held.
+        """
         try:
-            with open(file_path, "rb") as f:
-                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mmapped_file:
-                    yield mmapped_file
+            with open(file_path, encoding="utf-8", buffering=READ_BUFFER_SIZE) as f:
+                yield from f
         except Exception as e:
-            logging.error(f"Error memory-mapping file {file_path}: {e}")
+            logging.error(f"Error reading file {file_path}: {e}")
             raise
 
-    @functools.lru_cache(maxsize=128)
+    @contextmanager
+    def get_mmap_reader(self, file_path: str) -> Iterator[mmap.mmap]:
+        """
+        Get memory-mapped file reader for large files.
+
+        Use as ``with optimizer.get_mmap_reader(path) as mm:``; the file and
+        the map stay open until the block exits.
+        """
+        with ExitStack() as stack:
+            try:
+                f = stack.enter_context(open(file_path, "rb"))
+                mmapped_file = stack.enter_context(
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                )
+            except Exception as e:
+                logging.error(f"Error memory-mapping file {file_path}: {e}")
+                raise
+
+            yield mmapped_file
+
     def cached_operation(self, key: str, operation: Callable[[], T]) -> T:
-        """Cache expensive operations with memory management."""
-        return operation()
+        """
+        Cache expensive operations with memory management.
+
+        Results are cached per optimizer by ``key`` alone; ``operation`` only
+        runs on a miss. The least recently used entry is evicted once the
+        cache holds OPERATION_CACHE_SIZE results.
+        """
+        if key in self._op_cache:
+            self._op_cache.move_to_end(key)
+            return self._op_cache[key]
+
+        value = operation()
+        self._op_cache[key] = value
+        if len(self._op_cache) > self.OPERATION_CACHE_SIZE:
+            self._op_cache.popitem(last=False)
+        return value
 
     def clear_caches(self):
         """Clear all internal caches to free memory."""
-        self.cached_operation.cache_clear()
+        self._op_cache.clear()
         self._object_cache.clear()
         logging.info("Cleared internal caches")
 
     def stream_process_large_text(
         self, text: str, chunk_size: int = 10000
     ) -> Iterator[str]:
-        """Process large text in chunks to manage memory."""
-        for i in range(0, len(text), chunk_size):
-            yield text[i : i + chunk_size]
+        """
+        Process large text in chunks to manage memory.
+
+        Chunks are at most ``chunk_size`` characters and end just before the
+        last space in their window, so words are not cut in half; a window
+        without a space is cut at ``chunk_size``. Joined, they give ``text``.
+        """
+        start = 0
+        length = len(text)
+        while start < length:
+            end = min(start + chunk_size, length)
+            if end < length:
+                space = text.rfind(" ", start, end)
+                if space > start:
+                    end = space
+            yield text[start:end]
+            start = end
+
+
+# One VTT cue: a timing line (the line holding "-->"), then every following
+# non-blank line. "." stops at "\n", so each line is matched in one C-level scan
+_VTT_CUE_PATTERN = re.compile(rb"^(.*-->.*)$((?:\n.*\S.*)*)", re.MULTILINE)
 
 
 class StreamingVTTReader:
@@ -288,46 +390,34 @@ class StreamingVTTReader:
         self.buffer = ""
 
     def read_streaming(self, file_path: str) -> Iterator[dict[str, Any]]:
-        """Read VTT file in chunks and yield complete subtitle entries."""
+        """
+        Read VTT file in chunks and yield complete subtitle entries.
+
+        The file is memory-mapped and scanned one cue at a time, so only the
+        cue being yielded is ever decoded. Cues without text are skipped.
+        """
         try:
-            with open(file_path, encoding="utf-8") as f:
-                current_subtitle = {}
-                in_subtitle = False
-
-                for line in f:
-                    line = line.strip()
-
-                    # Skip WEBVTT header and empty lines at start
-                    if not line or line == "WEBVTT":
-                        continue
-
-                    # Check if this is a timestamp line
-                    if "-->" in line:
-                        current_subtitle["timestamp"] = line
-                        in_subtitle = True
-                        current_subtitle["text"] = []
-                        continue
-
-                    # If we're in a subtitle and hit an empty line, yield the subtitle
-                    if in_subtitle and not line:
-                        if current_subtitle.get("text"):
-                            current_subtitle["text"] = " ".join(
-                                current_subtitle["text"]
-                            )
-                            yield current_subtitle
-
-                        current_subtitle = {}
-                        in_subtitle = False
-                        continue
-
-                    # Add text lines to current subtitle
-                    if in_subtitle:
-                        current_subtitle["text"].append(line)
-
-                # Yield final subtitle if exists
-                if in_subtitle and current_subtitle.get("text"):
-                    current_subtitle["text"] = " ".join(current_subtitle["text"])
-                    yield current_subtitle
+            with open(file_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return
+
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for match in _VTT_CUE_PATTERN.finditer(mm):
+                        timing, lines = match.groups()
+                        if lines:
+                            # lines starts with the newline ending the timing
+                            # line; a one-line cue needs no split and join
+                            body = lines[1:]
+                            if b"\n" in body:
+                                text = b" ".join(
+                                    [line.strip() for line in body.split(b"\n")]
+                                )
+                            else:
+                                text = body.strip()
+                            yield {
+                                "timestamp": timing.strip().decode("utf-8"),
+                                "text": text.decode("utf-8"),
+                            }
 
         except Exception as e:
             logging.error(f"Error streaming VTT file {file_path}: {e}")
@@ -337,6 +427,12 @@ class StreamingVTTReader:
 class MemoryEfficientNLPProcessor:
     """Memory-efficient NLP processing for large texts."""
 
+    # Pipeline components entity extraction does not depend on
+    UNUSED_PIPES = ("parser", "tagger", "lemmatizer", "attribute_ruler")
+
+    # Chunks handed to spaCy per nlp.pipe batch when streaming
+    PIPE_BATCH_SIZE = 16
+
     def __init__(self, config: Optional[Config] = None):
         self.config = config or Config.get_default()
         self.optimizer = MemoryOptimizer(config)
@@ -349,9 +445,10 @@ class MemoryEfficientNLPProcessor:
             try:
                 import spacy
 
-                self._nlp_model = spacy.load("en_core_web_sm")
-                # Disable unnecessary pipeline components to save memory
-                self._nlp_model.disable_pipes(["parser", "tagger"])
+                # Only entities are needed, so never load the other components
+                self._nlp_model = spacy.load(
+                    "en_core_web_sm", exclude=list(self.UNUSED_PIPES)
+                )
             except Exception as e:
                 logging.error(f"Error loading spaCy model: {e}")
                 raise
@@ -362,18 +459,18 @@ class MemoryEfficientNLPProcessor:
     ) -> Iterator[dict[str, Any]]:
         """Process large text in memory-efficient chunks."""
         with self.optimizer.memory_monitoring("NLP processing"):
-            for chunk in self.optimizer.stream_process_large_text(text, chunk_size):
-                # Process chunk with NLP
-                doc = self.nlp_model(chunk)
+            chunks = self.optimizer.stream_process_large_text(text, chunk_size)
+
+            # nlp.pipe batches the chunks through the pipeline
+            for doc in self.nlp_model.pipe(chunks, batch_size=self.PIPE_BATCH_SIZE):
+                chunk = doc.text
 
                 # Extract entities and yield results
                 entities = [(ent.text, ent.label_) for ent in doc.ents]
 
                 yield {"text": chunk, "entities": entities, "length": len(chunk)}
 
-                # Force cleanup after each chunk
                 del doc
-                self.optimizer.force_garbage_collection()
 
     def extract_entities_batch(
         self, texts: list[str], batch_size: int = 10
@@ -385,55 +482,82 @@ class MemoryEfficientNLPProcessor:
             with self.optimizer.memory_monitoring(f"Batch {i // batch_size + 1}"):
                 results = []
 
-                for text in batch:
-                    doc = self.nlp_model(text)
+                docs = self.nlp_model.pipe(batch, batch_size=len(batch))
+                for text, doc in zip(batch, docs):
                     entities = [(ent.text, ent.label_) for ent in doc.ents]
                     results.append({"text": text, "entities": entities})
                     del doc
 
                 yield results
 
-                # Cleanup after batch
-                self.optimizer.force_garbage_collection()
 
+# Tracker shared by memory_limit; created on first use
+_shared_tracker: Optional[MemoryTracker] = None
+_shared_tracker_lock = threading.Lock()
+
+
+def _get_shared_tracker() -> MemoryTracker:
+    """Return the process-wide tracker used by memory_limit."""
+    global _shared_tracker
+    if _shared_tracker is None:
+        with _shared_tracker_lock:
+            if _shared_tracker is None:
+                _shared_tracker = MemoryTracker()
+    return _shared_tracker
+
+
+def memory_profile(
+    func: Optional[Callable] = None, *, tracker: Optional[MemoryTracker] = None
+) -> Callable:
+    """
+    Decorator to profile memory usage of functions.
 
-def memory_profile(func: Callable) -> Callable:
-    """Decorator to profile memory usage of functions."""
+    Use as ``@memory_profile`` or ``@memory_profile(tracker=...)``. Without a
+    tracker each call gets a fresh one, so its report covers that call only;
+    pass a tracker to reuse it and accumulate snapshots across calls.
+    """
+    if func is None:
+        return functools.partial(memory_profile, tracker=tracker)
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        tracker = MemoryTracker()
-        tracker.set_baseline()
-        tracker.take_snapshot(f"Start {func.__name__}")
+        call_tracker = tracker if tracker is not None else MemoryTracker()
+        call_tracker.set_baseline()
+        call_tracker.take_snapshot(f"Start {func.__name__}")
 
         try:
             result = func(*args, **kwargs)
             return result
         finally:
-            tracker.take_snapshot(f"End {func.__name__}")
+            call_tracker.take_snapshot(f"End {func.__name__}")
 
             # Log memory usage
-            growth = tracker.get_memory_growth()
+            growth = call_tracker.get_memory_growth()
             if growth and growth > 10:  # More than 10MB growth
                 logging.warning(
                     f"Function {func.__name__} used {growth:.1f} MB of memory"
                 )
 
-            tracker.print_memory_report()
+            call_tracker.print_memory_report()
 
     return wrapper
 
 
-def memory_limit(max_mb: int):
-    """Decorator to enforce memory limits on functions."""
+def memory_limit(max_mb: int, tracker: Optional[MemoryTracker] = None):
+    """
+    Decorator to enforce memory limits on functions.
+
+    RSS is read through one process-wide tracker rather than a new one per
+    call; pass ``tracker`` to use a separate one.
+    """
 
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            tracker = MemoryTracker()
+            call_tracker = tracker if tracker is not None else _get_shared_tracker()
 
             def check_memory():
-                current = tracker.get_current_metrics()
+                current = call_tracker.get_current_metrics()
                 if current.rss_mb > max_mb:
                     raise MemoryError(
                         f"Function {func.__name__} exceeded memory limit: "
@@ -464,6 +588,8 @@ class MemoryMonitoringService:
         self.tracker = MemoryTracker()
         self.running = False
         self.thread = None
+        # Set by stop(); also serves as the loop's interruptible sleep
+        self._stop_event = threading.Event()
 
         # Alert thresholds
         self.memory_threshold_mb = 1000  # 1GB
@@ -475,6 +601,7 @@ class MemoryMonitoringService:
             return
 
         self.running = True
+        self._stop_event.clear()
         self.tracker.set_baseline()
         self.thread = threading.Thread(target=self._monitor_loop)
         self.thread.daemon = True
@@ -485,6 +612,7 @@ class MemoryMonitoringService:
     def stop(self):
         """Stop the monitoring service."""
         self.running = False
+        self._stop_event.set()
         if self.thread:
             self.thread.join(timeout=5)
 
@@ -505,12 +633,11 @@ class MemoryMonitoringService:
                         f"Memory status: {metrics.rss_mb:.1f} MB RSS, "
                         f"{metrics.percent:.1f}% of system memory"
                     )
-
-                threading.Event().wait(self.interval)
-
             except Exception as e:
                 logging.error(f"Error in memory monitoring loop: {e}")
-                threading.Event().wait(self.interval)
+
+            if self._stop_event.wait(self.interval):
+                break
 
     def _check_alerts(self, metrics: MemoryMetrics):
         """Check for memory-related alerts."""
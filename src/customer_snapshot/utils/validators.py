@@ -3,6 +3,7 @@ Utility functions for secure file handling and validation.
 """
 
 import logging
+from collections.abc import Collection
 from pathlib import Path
 from typing import Optional, Union
 
@@ -12,7 +13,7 @@ logger = logging.getLogger(__name__)
 
 def validate_file_path(
     file_path: Union[str, Path],
-    allowed_extensions: Optional[list[str]] = None,
+    allowed_extensions: Optional[Collection[str]] = None,
     max_size: Optional[int] = None,
 ) -> Path:
     """
@@ -63,7 +64,7 @@ def validate_file_path(
 def safe_file_read(
     file_path: Union[str, Path],
     encoding: str = "utf-8",
-    allowed_extensions: Optional[list[str]] = None,
+    allowed_extensions: Optional[Collection[str]] = None,
 ) -> str:
     """
     Safely read file with proper error handling.
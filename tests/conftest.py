@@ -158,3 +158,6 @@ def cleanup_env():
     for var in test_vars:
         if var in os.environ:
             del os.environ[var]
+
+    # Drop configs built from this test's environment
+    Config.clear_cache()
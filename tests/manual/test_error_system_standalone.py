@@ -5,8 +5,11 @@ Standalone test for error tracking system functionality.
 This test bypasses package imports to test core error tracking functionality.
 """
 
+import importlib.util
 import os
 import sys
+import traceback
+from collections import Counter
 from datetime import datetime
 
 
@@ -18,6 +21,9 @@ utils_dir = os.path.join(current_dir, "src", "customer_snapshot", "utils")
 sys.path.insert(0, monitoring_dir)
 sys.path.insert(0, utils_dir)
 
+# Dashboard icon per severity, shared by every formatted line
+SEVERITY_ICONS = {"error": "❌", "warning": "⚠️"}
+
 
 # Test direct imports
 def test_error_tracker_imports():
@@ -25,23 +31,26 @@ def test_error_tracker_imports():
     print("🧪 Testing error tracker imports...")
 
     try:
-        # Test imports without dependencies
-        exec("""
-import os
-import sys
-import json
-import time
-import logging
-import traceback
-import threading
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable
-from dataclasses import dataclass, asdict
-from enum import Enum
-from collections import defaultdict, deque
-import hashlib
-import uuid
-""")
+        # Only availability matters; the modules need not be executed again
+        modules = [
+            "os",
+            "sys",
+            "json",
+            "time",
+            "logging",
+            "traceback",
+            "threading",
+            "datetime",
+            "typing",
+            "dataclasses",
+            "enum",
+            "collections",
+            "hashlib",
+            "uuid",
+        ]
+        missing = [name for name in modules if importlib.util.find_spec(name) is None]
+        if missing:
+            raise ImportError(f"Missing modules: {', '.join(missing)}")
         print("✅ Core dependencies imported successfully")
 
         return True
@@ -140,8 +149,6 @@ def test_error_classification():
 
     except Exception as e:
         print(f"❌ Error classification test failed: {e}")
-        import traceback
-
         traceback.print_exc()
         return False
 
@@ -161,7 +168,7 @@ def test_error_aggregation():
 
             def generate_fingerprint(self, message, exception_type, stack_trace):
                 signature = f"{exception_type}|{message[:100]}|{stack_trace[:200]}"
-                return hashlib.md5(signature.encode()).hexdigest()
+                return hashlib.sha256(signature.encode()).hexdigest()
 
             def add_error(self, error_id, fingerprint):
                 if fingerprint in self.error_cache:
@@ -199,8 +206,6 @@ def test_error_aggregation():
 
     except Exception as e:
         print(f"❌ Error aggregation test failed: {e}")
-        import traceback
-
         traceback.print_exc()
         return False
 
@@ -236,8 +241,6 @@ def test_error_context():
 
     except Exception as e:
         print(f"❌ Error context test failed: {e}")
-        import traceback
-
         traceback.print_exc()
         return False
 
@@ -255,17 +258,15 @@ def test_error_handling_decorators():
             def decorator(func):
                 @functools.wraps(func)
                 def wrapper(*args, **kwargs):
-                    last_exception = None
-
-                    for attempt in range(max_attempts):
+                    # The final attempt runs outside the loop, so its
+                    # exception propagates without being stored and re-raised
+                    for _ in range(max_attempts - 1):
                         try:
                             return func(*args, **kwargs)
-                        except Exception as e:
-                            last_exception = e
-                            if attempt < max_attempts - 1:
-                                time.sleep(delay)
+                        except Exception:
+                            time.sleep(delay)
 
-                    raise last_exception
+                    return func(*args, **kwargs)
 
                 return wrapper
 
@@ -313,8 +314,6 @@ def test_error_handling_decorators():
 
     except Exception as e:
         print(f"❌ Error handling decorators test failed: {e}")
-        import traceback
-
         traceback.print_exc()
         return False
 
@@ -324,13 +323,12 @@ def test_error_dashboard_functionality():
     print("\n🧪 Testing error dashboard functionality...")
 
     try:
-        from datetime import datetime
-
-        # Mock error data
+        # Mock error data; one timestamp serves every record
+        now = datetime.now().isoformat()
         mock_errors = [
             {
                 "id": "error1",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now,
                 "severity": "error",
                 "category": "api_error",
                 "message": "API timeout",
@@ -338,7 +336,7 @@ def test_error_dashboard_functionality():
             },
             {
                 "id": "error2",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now,
                 "severity": "warning",
                 "category": "validation",
                 "message": "Invalid input format",
@@ -348,19 +346,12 @@ def test_error_dashboard_functionality():
 
         # Test statistics calculation
         total_errors = len(mock_errors)
-        severity_counts = {}
-        category_counts = {}
+        severity_counts = Counter()
+        category_counts = Counter()
 
         for error in mock_errors:
-            severity = error["severity"]
-            category = error["category"]
-
-            severity_counts[severity] = (
-                severity_counts.get(severity, 0) + error["count"]
-            )
-            category_counts[category] = (
-                category_counts.get(category, 0) + error["count"]
-            )
+            severity_counts[error["severity"]] += error["count"]
+            category_counts[error["category"]] += error["count"]
 
         assert total_errors == 2
         assert severity_counts["error"] == 3
@@ -373,7 +364,7 @@ def test_error_dashboard_functionality():
             return "just now"  # Simplified for test
 
         def format_dashboard_line(error):
-            severity_icon = {"error": "❌", "warning": "⚠️"}.get(error["severity"], "❓")
+            severity_icon = SEVERITY_ICONS.get(error["severity"], "❓")
             return f"{severity_icon} {error['message']} (Count: {error['count']})"
 
         lines = [format_dashboard_line(error) for error in mock_errors]
@@ -385,8 +376,6 @@ def test_error_dashboard_functionality():
 
     except Exception as e:
         print(f"❌ Error dashboard test failed: {e}")
-        import traceback
-
         traceback.print_exc()
         return False
 
@@ -396,9 +385,8 @@ def test_error_export():
     print("\n🧪 Testing error export...")
 
     try:
+        import io
         import json
-        import os
-        import tempfile
 
         # Mock error data
         export_data = {
@@ -420,29 +408,23 @@ def test_error_export():
             ],
         }
 
-        # Test JSON export
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(export_data, f, indent=2)
-            export_file = f.name
+        # Test JSON export; the round trip is checked in memory, not on disk
+        buffer = io.StringIO()
+        json.dump(export_data, buffer, indent=2)
 
         # Verify export
-        with open(export_file) as f:
-            loaded_data = json.load(f)
+        buffer.seek(0)
+        loaded_data = json.load(buffer)
 
         assert loaded_data["total_errors"] == 2
         assert len(loaded_data["errors"]) == 2
         assert loaded_data["errors"][0]["message"] == "Test error 1"
 
-        # Cleanup
-        os.unlink(export_file)
-
         print("✅ Error export works")
         return True
 
     except Exception as e:
         print(f"❌ Error export test failed: {e}")
-        import traceback
-
         traceback.print_exc()
         return False
 
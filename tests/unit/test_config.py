@@ -69,9 +69,12 @@ class TestConfig:
 
         config = Config()
 
-        with pytest.raises(ValueError, match="Configuration errors"):
+        with pytest.raises(ValueError, match="Configuration errors") as exc_info:
             config.validate()
 
+        assert "MAX_TOKENS must be positive" in str(exc_info.value)
+        assert "TEMPERATURE must be between 0 and 1" in str(exc_info.value)
+
     def test_config_to_dict(self):
         """Test configuration serialization to dictionary."""
         os.environ["ANTHROPIC_API_KEY"] = "test_key"
@@ -87,6 +90,28 @@ class TestConfig:
         # Ensure sensitive data is not included
         assert "anthropic_api_key" not in config_dict
 
+    def test_config_as_dict_is_cached_and_invalidated(self):
+        """Test that the config snapshot is reused until a setting changes."""
+        config = Config()
+        snapshot = config.as_dict
+
+        assert config.as_dict is snapshot
+        with pytest.raises(TypeError):
+            snapshot["max_tokens"] = 1
+
+        config.max_tokens = 1234
+
+        assert config.as_dict is not snapshot
+        assert config.to_dict()["max_tokens"] == 1234
+
+    def test_config_lazy_settings_parsed_on_first_access(self):
+        """Test that rarely used settings are only parsed when read."""
+        config = Config()
+
+        assert "chunk_size" not in vars(config)
+        assert config.chunk_size == int(os.getenv("CHUNK_SIZE", "500"))
+        assert "chunk_size" in vars(config)
+
     def test_config_from_env_file(self, temp_dir):
         """Test configuration from specific .env file."""
         env_file = temp_dir / ".env.test"
@@ -120,6 +145,22 @@ DEBUG=true
         assert config.output_dir.exists()
         assert config.templates_dir.exists()
 
+    def test_config_directory_creation_fills_missing_leaves(self, temp_dir):
+        """Test that only missing directories are created next to existing ones."""
+        config = Config()
+        config.data_dir = temp_dir / "test_data"
+        config.input_dir = config.data_dir / "input"
+        config.output_dir = config.data_dir / "output"
+        config.templates_dir = config.data_dir / "templates"
+        config.input_dir.mkdir(parents=True)
+        (config.input_dir / "keep.vtt").write_text("WEBVTT")
+
+        config._ensure_directories()
+
+        assert (config.input_dir / "keep.vtt").exists()
+        assert config.output_dir.is_dir()
+        assert config.templates_dir.is_dir()
+
     def test_config_get_default(self):
         """Test getting default configuration."""
         config = Config.get_default()
@@ -127,6 +168,16 @@ DEBUG=true
         assert isinstance(config, Config)
         assert config.default_model == "claude-sonnet-4-5-20250929"
 
+    def test_config_get_default_is_cached(self):
+        """Test that repeated default lookups reuse one instance."""
+        Config.clear_cache()
+        config = Config.get_default()
+
+        assert Config.get_default() is config
+
+        Config.clear_cache()
+        assert Config.get_default() is not config
+
     @pytest.mark.parametrize(
         "env_var,expected_type",
         [
@@ -168,6 +219,25 @@ DEBUG=true
 
         assert isinstance(value, expected_type)
 
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [("true", True), ("1", True), ("Yes", True), (" on ", True), ("false", False)],
+    )
+    def test_config_boolean_flag_parsing(self, raw, expected):
+        """Test that boolean flags accept the common truthy spellings."""
+        os.environ["DEBUG"] = raw
+
+        assert Config().debug is expected
+
+    def test_config_invalid_integer_names_variable(self):
+        """Test that a malformed integer reports the offending variable."""
+        os.environ["MEMORY_LIMIT_MB"] = "lots"
+        try:
+            with pytest.raises(ValueError, match="MEMORY_LIMIT_MB"):
+                Config()
+        finally:
+            del os.environ["MEMORY_LIMIT_MB"]
+
     def test_config_allowed_extensions_parsing(self):
         """Test parsing of allowed extensions from environment variable."""
         os.environ["ALLOWED_EXTENSIONS"] = ".vtt,.txt,.md,.html"
@@ -179,3 +249,11 @@ DEBUG=true
         assert ".md" in config.allowed_extensions
         assert ".html" in config.allowed_extensions
         assert len(config.allowed_extensions) == 4
+
+    def test_config_allowed_extensions_normalized(self):
+        """Test that allowed extensions are stripped and lower-cased."""
+        os.environ["ALLOWED_EXTENSIONS"] = " .VTT, .Txt ,,.md"
+
+        config = Config()
+
+        assert config.allowed_extensions == frozenset({".vtt", ".txt", ".md"})
@@ -0,0 +1,472 @@
+"""
+Unit tests for error handling utilities.
+"""
+
+import contextvars
+import dataclasses
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from customer_snapshot.utils import error_handling
+from customer_snapshot.utils.error_handling import (
+    AGGRESSIVE_RETRY_CONFIG,
+    NO_RETRY_CONFIG,
+    SILENT_FAIL_CONFIG,
+    STANDARD_CONFIG,
+    CircuitBreaker,
+    ErrorBoundary,
+    ErrorHandlingConfig,
+    handle_api_calls,
+    handle_file_operations,
+    safe_execute,
+    with_error_tracking,
+    with_retry,
+    with_timeout,
+)
+
+
+@pytest.fixture
+def tracker():
+    """Replace the global error tracker with a mock."""
+    mock_tracker = Mock()
+    with patch.object(error_handling, "get_error_tracker", return_value=mock_tracker):
+        yield mock_tracker
+
+
+@pytest.fixture
+def sleeps():
+    """Record retry delays instead of sleeping."""
+    with patch.object(error_handling.time, "sleep") as mock_sleep:
+        yield mock_sleep
+
+
+class TestWithErrorTracking:
+    """Test cases for the with_error_tracking decorator."""
+
+    def test_failure_is_tracked_with_context(self, tracker):
+        """Test that a failure is tracked once with call details."""
+
+        @with_error_tracking(context_data={"job": "sync"})
+        def fail(a, b, flag=False):
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            fail(1, 2, flag=True)
+
+        tracker.track_exception.assert_called_once()
+        error, context = tracker.track_exception.call_args.args
+        assert isinstance(error, ValueError)
+        assert context.function_name == "fail"
+        assert context.additional_data == {
+            "args_count": 2,
+            "kwargs_keys": ("flag",),
+            "job": "sync",
+        }
+
+    def test_success_is_not_tracked(self, tracker):
+        """Test that successful calls never reach the tracker."""
+
+        @with_error_tracking()
+        def succeed():
+            return 42
+
+        assert succeed() == 42
+        tracker.track_exception.assert_not_called()
+
+    def test_no_reraise_returns_none(self, tracker):
+        """Test that reraise=False swallows the error after tracking it."""
+
+        @with_error_tracking(reraise=False)
+        def fail():
+            raise ValueError("boom")
+
+        assert fail() is None
+        tracker.track_exception.assert_called_once()
+
+
+class TestWithTimeout:
+    """Test cases for the with_timeout decorator."""
+
+    def test_result_is_returned(self, tracker):
+        """Test that a fast call returns its result untouched."""
+
+        @with_timeout(1)
+        def add(a, b=0):
+            return a + b
+
+        assert add(1, b=2) == 3
+        tracker.track_exception.assert_not_called()
+
+    def test_overrun_raises_and_is_tracked(self, tracker):
+        """Test that a call exceeding the limit raises TimeoutError."""
+        release = threading.Event()
+
+        @with_timeout(0.05)
+        def hang():
+            release.wait(5)
+
+        try:
+            with pytest.raises(TimeoutError, match="hang timed out"):
+                hang()
+        finally:
+            release.set()
+
+        tracker.track_exception.assert_called_once()
+
+    def test_own_timeout_error_is_not_rewrapped(self, tracker):
+        """Test that a TimeoutError raised by the function propagates as is."""
+        original = TimeoutError("socket read timed out")
+
+        @with_timeout(5)
+        def read():
+            raise original
+
+        start = time.monotonic()
+        with pytest.raises(TimeoutError) as excinfo:
+            read()
+
+        assert excinfo.value is original
+        assert time.monotonic() - start < 1
+
+    def test_other_exceptions_propagate(self, tracker):
+        """Test that other errors from the function are re-raised."""
+
+        @with_timeout(1)
+        def fail():
+            raise KeyError("missing")
+
+        with pytest.raises(KeyError):
+            fail()
+
+    def test_abandoned_calls_do_not_starve_others(self, tracker):
+        """Test that hung calls do not block unrelated timed calls."""
+        release = threading.Event()
+
+        @with_timeout(0.01)
+        def hang():
+            release.wait(5)
+
+        @with_timeout(0.5)
+        def answer():
+            return 42
+
+        try:
+            for _ in range(16):
+                with pytest.raises(TimeoutError):
+                    hang()
+
+            assert answer() == 42
+        finally:
+            release.set()
+
+    def test_context_variables_are_visible(self, tracker):
+        """Test that the caller's context variables reach the function."""
+        request_id = contextvars.ContextVar("request_id")
+        request_id.set("abc")
+
+        @with_timeout(1)
+        def read_request_id():
+            return request_id.get()
+
+        assert read_request_id() == "abc"
+
+
+class TestCircuitBreaker:
+    """Test cases for the CircuitBreaker decorator."""
+
+    def test_closed_breaker_passes_calls_through(self, tracker):
+        """Test that a closed breaker returns results and resets failures."""
+        breaker = CircuitBreaker(failure_threshold=3)
+        breaker.failure_count = 2
+
+        @breaker
+        def succeed():
+            return "ok"
+
+        assert succeed() == "ok"
+        assert breaker.state == "closed"
+        assert breaker.failure_count == 0
+
+    def test_opens_after_threshold(self, tracker):
+        """Test that consecutive failures open the breaker."""
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+
+        @breaker
+        def fail():
+            raise ConnectionError("down")
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                fail()
+
+        assert breaker.state == "open"
+        assert tracker.track_exception.call_count == 2
+        with pytest.raises(Exception, match="Circuit breaker is OPEN"):
+            fail()
+
+    def test_half_open_success_closes(self, tracker):
+        """Test that a successful trial call after recovery closes it."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+        outcomes = [ConnectionError("down"), "ok"]
+
+        @breaker
+        def call():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        with pytest.raises(ConnectionError):
+            call()
+        assert breaker.state == "open"
+
+        assert call() == "ok"
+        assert breaker.state == "closed"
+
+    def test_unexpected_exceptions_are_not_counted(self, tracker):
+        """Test that only expected_exception counts as a failure."""
+        breaker = CircuitBreaker(failure_threshold=1, expected_exception=IOError)
+
+        @breaker
+        def fail():
+            raise ValueError("bad input")
+
+        with pytest.raises(ValueError):
+            fail()
+
+        assert breaker.state == "closed"
+        assert breaker.failure_count == 0
+
+    def test_state_can_be_assigned_by_name(self, tracker):
+        """Test that the state can still be set with its string name."""
+        breaker = CircuitBreaker(recovery_timeout=60)
+        breaker.last_failure_time = time.time()
+        breaker.state = "open"
+
+        @breaker
+        def succeed():
+            return "ok"
+
+        with pytest.raises(Exception, match="Circuit breaker is OPEN"):
+            succeed()
+
+        breaker.state = "closed"
+        assert succeed() == "ok"
+
+    def test_unknown_state_is_rejected(self):
+        """Test that assigning an unknown state name fails loudly."""
+        breaker = CircuitBreaker()
+
+        with pytest.raises(ValueError, match="Unknown circuit breaker state"):
+            breaker.state = "broken"
+
+
+def _flaky(failures):
+    """Build a function that raises each of ``failures`` before succeeding."""
+    remaining = list(failures)
+
+    def flaky(*args, **kwargs):
+        if remaining:
+            raise remaining.pop(0)
+        return "done"
+
+    return flaky
+
+
+class TestWithRetry:
+    """Test cases for the with_retry decorator."""
+
+    def test_retries_until_success(self, tracker, sleeps):
+        """Test that transient failures are retried with exponential backoff."""
+        on_retry = Mock()
+        flaky = with_retry(max_attempts=3, delay=0.5, on_retry=on_retry)(
+            _flaky([ValueError("1"), ValueError("2")])
+        )
+
+        assert flaky("x") == "done"
+        assert [c.args[0] for c in sleeps.call_args_list] == [0.5, 1.0]
+        assert [c.args[0] for c in on_retry.call_args_list] == [1, 2]
+        tracker.track_exception.assert_not_called()
+
+    def test_final_failure_is_tracked_once(self, tracker, sleeps):
+        """Test that exhausting the attempts tracks only the last error."""
+        errors = [ValueError(str(i)) for i in range(3)]
+        flaky = with_retry(max_attempts=3)(_flaky(errors))
+
+        with pytest.raises(ValueError) as excinfo:
+            flaky()
+
+        assert excinfo.value is errors[-1]
+        tracker.track_exception.assert_called_once()
+        error, context = tracker.track_exception.call_args.args
+        assert error is errors[-1]
+        assert context.additional_data["final_failure"] is True
+        assert context.additional_data["retry_attempt"] == 3
+
+    def test_other_exceptions_are_not_retried(self, tracker, sleeps):
+        """Test that exceptions outside ``exceptions`` propagate at once."""
+        flaky = with_retry(exceptions=(IOError,))(_flaky([KeyError("k")]))
+
+        with pytest.raises(KeyError):
+            flaky()
+
+        sleeps.assert_not_called()
+
+
+class TestOperationHandlers:
+    """Test cases for the predefined handle_* decorators."""
+
+    def test_file_operation_recovers(self, tracker, sleeps):
+        """Test that an OSError is retried and success is not tracked."""
+        read = handle_file_operations(_flaky([OSError("busy")]))
+
+        assert read() == "done"
+        assert sleeps.call_count == 1
+        tracker.track_exception.assert_not_called()
+
+    def test_final_failure_is_tracked_once(self, tracker, sleeps):
+        """Test that a failure surviving every retry is tracked once."""
+        read = handle_file_operations(_flaky([OSError("busy")] * 3))
+
+        with pytest.raises(OSError):
+            read("path.txt", mode="r")
+
+        assert sleeps.call_count == 2
+        tracker.track_exception.assert_called_once()
+        context = tracker.track_exception.call_args.args[1]
+        assert context.additional_data == {
+            "args_count": 1,
+            "kwargs_keys": ("mode",),
+            "retry_attempt": 3,
+            "max_attempts": 3,
+            "final_failure": True,
+        }
+
+    def test_non_retryable_error_is_tracked_once(self, tracker, sleeps):
+        """Test that an error outside the retry set fails fast, tracked once."""
+        read = handle_file_operations(_flaky([ValueError("bad format")]))
+
+        with pytest.raises(ValueError):
+            read()
+
+        sleeps.assert_not_called()
+        tracker.track_exception.assert_called_once()
+        context = tracker.track_exception.call_args.args[1]
+        assert "final_failure" not in context.additional_data
+
+    def test_api_call_runs_under_timeout(self, tracker, sleeps):
+        """Test that API calls are retried through the timeout wrapper."""
+        calling_threads = []
+
+        def call_api():
+            calling_threads.append(threading.current_thread())
+            if len(calling_threads) == 1:
+                raise ConnectionError("reset")
+            return "response"
+
+        assert handle_api_calls(call_api)() == "response"
+        assert len(calling_threads) == 2
+        assert threading.current_thread() not in calling_threads
+
+
+class TestErrorBoundary:
+    """Test cases for the ErrorBoundary context manager."""
+
+    def test_clean_block_records_nothing(self, tracker):
+        """Test that a block without errors leaves the boundary empty."""
+        with ErrorBoundary("clean") as boundary:
+            pass
+
+        assert boundary.errors == []
+        assert boundary.get_result("default") is None
+        tracker.track_exception.assert_not_called()
+
+    def test_error_is_contained_and_tracked(self, tracker):
+        """Test that errors are suppressed and the fallback is offered."""
+        with ErrorBoundary("risky", fallback_value="fallback") as boundary:
+            raise ValueError("boom")
+
+        assert boundary.errors == [tracker.track_exception.return_value]
+        assert boundary.get_result("default") == "fallback"
+
+    def test_reraise_propagates(self, tracker):
+        """Test that reraise=True lets the error escape after tracking."""
+        with pytest.raises(ValueError), ErrorBoundary("strict", reraise=True):
+            raise ValueError("boom")
+
+        tracker.track_exception.assert_called_once()
+
+    def test_untracked_boundary_skips_tracker(self, tracker):
+        """Test that track_errors=False never reaches the tracker."""
+        with ErrorBoundary("quiet", track_errors=False) as boundary:
+            raise ValueError("boom")
+
+        assert boundary.errors == []
+        tracker.track_exception.assert_not_called()
+
+    def test_has_no_instance_dict(self):
+        """Test that boundaries use slots rather than a per-instance dict."""
+        boundary = ErrorBoundary("slotted")
+
+        assert not hasattr(boundary, "__dict__")
+        with pytest.raises(AttributeError):
+            boundary.unexpected = True
+
+
+class TestSafeExecute:
+    """Test cases for safe_execute."""
+
+    def test_returns_result(self, tracker, sleeps):
+        """Test that a successful call returns its result."""
+        assert safe_execute(lambda a, b: a + b, 1, 2) == 3
+        sleeps.assert_not_called()
+
+    def test_returns_fallback_after_retries(self, tracker, sleeps):
+        """Test that every attempt is tracked before falling back."""
+        flaky = _flaky([ValueError(str(i)) for i in range(3)])
+
+        assert safe_execute(flaky, fallback_value="fb", retry_count=2) == "fb"
+        assert tracker.track_exception.call_count == 3
+        assert sleeps.call_count == 2
+
+    def test_delays_are_jittered_around_the_table(self, tracker, sleeps):
+        """Test that each delay stays within 20% of its progressive base."""
+        flaky = _flaky([ValueError(str(i)) for i in range(7)])
+
+        assert safe_execute(flaky, retry_count=7) == "done"
+
+        bases = [1.0, 2.0, 3.0, 4.0, 5.0, 5.0, 5.0]
+        delays = [c.args[0] for c in sleeps.call_args_list]
+        assert len(delays) == len(bases)
+        for waited, base in zip(delays, bases):
+            assert 0.8 * base <= waited <= 1.2 * base
+
+
+class TestErrorHandlingConfig:
+    """Test cases for ErrorHandlingConfig and its presets."""
+
+    def test_presets(self):
+        """Test that the presets keep their documented values."""
+        assert (STANDARD_CONFIG.retry_attempts, STANDARD_CONFIG.retry_delay) == (3, 1.0)
+        assert AGGRESSIVE_RETRY_CONFIG.retry_attempts == 5
+        assert AGGRESSIVE_RETRY_CONFIG.retry_delay == 0.5
+        assert NO_RETRY_CONFIG.retry_attempts == 1
+        assert NO_RETRY_CONFIG.retry_delay == 0
+        assert SILENT_FAIL_CONFIG.retry_attempts == 1
+        assert SILENT_FAIL_CONFIG.raise_on_failure is False
+
+    def test_is_immutable(self):
+        """Test that shared presets cannot be modified in place."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            STANDARD_CONFIG.retry_attempts = 10
+
+    def test_replace_derives_new_config(self):
+        """Test that variants are derived with dataclasses.replace."""
+        config = dataclasses.replace(STANDARD_CONFIG, timeout=5.0)
+
+        assert config.timeout == 5.0
+        assert STANDARD_CONFIG.timeout is None
+        assert config == ErrorHandlingConfig(timeout=5.0)
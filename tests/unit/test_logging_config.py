@@ -0,0 +1,279 @@
+"""
+Unit tests for logging configuration.
+"""
+
+import logging
+import logging.handlers
+import re
+import timeit
+from unittest.mock import patch
+
+import pytest
+
+from customer_snapshot.utils.logging_config import (
+    SecureFormatter,
+    get_logger,
+    log_function_call,
+    setup_logging,
+    stop_queue_listener,
+)
+
+
+def _format(message: str) -> str:
+    """Format a bare message with SecureFormatter."""
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+    return SecureFormatter("%(message)s").format(record)
+
+
+class TestSecureFormatter:
+    """Test cases for sensitive data redaction."""
+
+    @pytest.mark.parametrize(
+        "message,secret",
+        [
+            ("api_key=sk-abc123 used", "sk-abc123"),
+            ("anthropic_api_key=sk-ant-123", "sk-ant-123"),
+            ("voyage-api-key: vk_1", "vk_1"),
+            ("token=abc.def-ghi", "abc.def-ghi"),
+            ("Bearer eyJhbGciOi.JIUzI1", "eyJhbGciOi.JIUzI1"),
+            ("password=hunter2!", "hunter2!"),
+            ("passwd=s3cret", "s3cret"),
+            ("PASSWORD=Hunter2 and API_KEY=ABC", "Hunter2"),
+            ("PA\u017f\u017fWORD=hunter2", "hunter2"),
+            ("card 1234 5678 9012 3456 end", "1234 5678 9012 3456"),
+            ("password=" + "A" * 520 + "TAILSECRET", "TAILSECRET"),
+            ("token=" + "t" * 5000 + "TAILSECRET", "TAILSECRET"),
+            ("api_key:" + " " * 9 + "sk-live-123", "sk-live-123"),
+            ("bearer" + " " * 12 + "eyJhbGciOi", "eyJhbGciOi"),
+        ],
+    )
+    def test_secrets_are_redacted(self, message, secret):
+        """Test that secret values never reach the formatted output."""
+        formatted = _format(message)
+
+        assert secret not in formatted
+        assert "REDACTED" in formatted
+
+    def test_email_is_partially_redacted(self):
+        """Test that email addresses keep only the local part and domain."""
+        assert _format("mail john.doe@example.com now") == (
+            "mail john.doe***@example.com now"
+        )
+
+    def test_long_email_local_part_is_redacted(self):
+        """Test that a local part over 64 characters loses its tail."""
+        formatted = _format("mail " + "a" * 64 + "TAILSECRET@example.com now")
+
+        assert "TAILSECRET" not in formatted
+        assert formatted == "mail " + "a" * 64 + "***@example.com now"
+
+    def test_ip_address_is_partially_redacted(self):
+        """Test that IP addresses keep only the first and last octet."""
+        assert _format("ip 192.168.10.200 here") == "ip 192.***.***.200 here"
+
+    def test_plain_message_is_unchanged(self):
+        """Test that messages without sensitive data pass through."""
+        assert _format("Loaded 42 items in 3.5s") == "Loaded 42 items in 3.5s"
+
+    def test_multiple_secrets_in_one_message(self):
+        """Test that every sensitive value in a message is redacted."""
+        formatted = _format("user bob@x.io token=zz password=pp 10.0.0.1")
+
+        assert formatted == (
+            "user bob***@x.io token=[REDACTED] password=[REDACTED] 10.***.***.1"
+        )
+
+    @pytest.mark.parametrize(
+        "pattern", [pattern for pattern, _ in SecureFormatter.SENSITIVE_PATTERNS]
+    )
+    def test_patterns_stay_fast_on_long_lines(self, pattern):
+        """Test that no pattern backtracks quadratically on a long line."""
+        compiled = re.compile(pattern, re.IGNORECASE)
+        line = "x" * 200000
+
+        # Best of three, so a single scheduler hiccup does not fail the test
+        elapsed = min(
+            timeit.timeit(lambda: compiled.search(line), number=1) for _ in range(3)
+        )
+
+        assert elapsed < 0.01
+
+
+class TestStructuredLogger:
+    """Test cases for StructuredLogger."""
+
+    def test_context_is_appended(self, caplog):
+        """Test that default and per-call context follow the message."""
+        logger = get_logger("test.structured", {"component": "reader"})
+
+        with caplog.at_level(logging.INFO, logger="test.structured"):
+            logger.info("Processing started", {"file": "input.vtt"})
+
+        assert caplog.messages == [
+            "Processing started | component=reader | file=input.vtt"
+        ]
+
+    def test_call_context_overrides_default_keys(self, caplog):
+        """Test that a per-call key replaces the default value in place."""
+        logger = get_logger("test.structured", {"component": "reader", "run": 1})
+
+        with caplog.at_level(logging.INFO, logger="test.structured"):
+            logger.info("Retrying", {"run": 2, "file": "a.vtt"})
+            logger.info("Idle")
+
+        assert caplog.messages == [
+            "Retrying | component=reader | run=2 | file=a.vtt",
+            "Idle | component=reader | run=1",
+        ]
+
+    def test_message_without_context_is_logged_verbatim(self, caplog):
+        """Test that percent signs in the message are not interpolated."""
+        logger = get_logger("test.structured")
+
+        with caplog.at_level(logging.INFO, logger="test.structured"):
+            logger.info("Progress 50%s done")
+
+        assert caplog.messages == ["Progress 50%s done"]
+
+    def test_disabled_level_skips_context_formatting(self, caplog):
+        """Test that filtered-out records never stringify their context."""
+
+        class Tracked:
+            formatted = False
+
+            def __str__(self):
+                Tracked.formatted = True
+                return "tracked"
+
+        logger = get_logger("test.structured")
+
+        with caplog.at_level(logging.WARNING, logger="test.structured"):
+            logger.debug("Details", {"value": Tracked()})
+
+        assert caplog.records == []
+        assert Tracked.formatted is False
+
+
+class TestSetupLogging:
+    """Test cases for setup_logging."""
+
+    @pytest.fixture(autouse=True)
+    def restore_root_logger(self):
+        """Restore the root logger's handlers and level after each test."""
+        root_logger = logging.getLogger()
+        handlers, level = root_logger.handlers[:], root_logger.level
+        yield
+        stop_queue_listener()
+        root_logger.handlers[:] = handlers
+        root_logger.setLevel(level)
+
+    def test_root_logger_only_enqueues(self, temp_dir):
+        """Test that the root logger hands records to a queue."""
+        setup_logging("INFO", temp_dir / "app.log")
+
+        handlers = logging.getLogger().handlers
+        assert len(handlers) == 1
+        assert isinstance(handlers[0], logging.handlers.QueueHandler)
+
+    def test_records_are_written_and_sanitized(self, temp_dir):
+        """Test that queued records reach the file with secrets redacted."""
+        log_file = temp_dir / "logs" / "app.log"
+        setup_logging("INFO", log_file, format_string="%(levelname)s %(message)s")
+
+        logging.getLogger("test.setup").info("login password=hunter2")
+        logging.getLogger("test.setup").debug("filtered out")
+        stop_queue_listener()
+
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        assert "INFO login password=[REDACTED]" in lines
+        assert not any("hunter2" in line or "filtered" in line for line in lines)
+
+    def test_repeated_setup_replaces_listener(self, temp_dir):
+        """Test that configuring twice leaves a single queue handler."""
+        setup_logging("INFO", temp_dir / "first.log")
+        setup_logging("WARNING", temp_dir / "second.log")
+
+        logging.getLogger("test.setup").warning("only once")
+        stop_queue_listener()
+
+        assert len(logging.getLogger().handlers) == 1
+        assert "only once" not in (temp_dir / "first.log").read_text()
+        assert "only once" in (temp_dir / "second.log").read_text()
+
+    def test_tracebacks_are_sanitized(self, temp_dir):
+        """Test that exception text is redacted along with the message."""
+        log_file = temp_dir / "app.log"
+        setup_logging("INFO", log_file)
+
+        try:
+            raise ValueError("bad token=abc123")
+        except ValueError:
+            logging.getLogger("test.setup").exception("call failed for %s", "a@b.io")
+        stop_queue_listener()
+
+        text = log_file.read_text(encoding="utf-8")
+        assert "Traceback" in text
+        assert "token=[REDACTED]" in text
+        assert "a***@b.io" in text
+        assert "abc123" not in text
+
+    def test_records_are_sanitized_once(self, temp_dir):
+        """Test that console and file output share a single redaction pass."""
+        setup_logging("INFO", temp_dir / "app.log")
+
+        with patch.object(
+            SecureFormatter,
+            "_sanitize_message",
+            autospec=True,
+            side_effect=lambda self, message: message,
+        ) as sanitize:
+            logging.getLogger("test.setup").warning("fan out")
+            stop_queue_listener()
+
+        messages = [call.args[1] for call in sanitize.call_args_list]
+        assert messages.count("fan out") == 1
+
+
+class TestLogFunctionCall:
+    """Test cases for the log_function_call decorator."""
+
+    def test_logs_entry_and_completion(self, caplog):
+        """Test that calls are logged at DEBUG with their argument counts."""
+
+        @log_function_call
+        def process_file(filename, mode="r"):
+            return f"Processed {filename}"
+
+        with caplog.at_level(logging.DEBUG, logger=__name__):
+            assert process_file("a.vtt", mode="w") == "Processed a.vtt"
+
+        assert caplog.messages == [
+            "Calling process_file with 1 args and 1 kwargs",
+            "process_file completed successfully",
+        ]
+
+    def test_logs_failure(self, caplog):
+        """Test that failures are logged at ERROR and re-raised."""
+
+        @log_function_call
+        def fail():
+            raise ValueError("bad input")
+
+        with caplog.at_level(logging.ERROR, logger=__name__), pytest.raises(ValueError):
+            fail()
+
+        assert caplog.messages == ["fail failed: ValueError: bad input"]
+
+    def test_follows_runtime_level_changes(self, caplog):
+        """Test that the level is checked per call, not at decoration."""
+
+        @log_function_call
+        def noop():
+            return None
+
+        with caplog.at_level(logging.INFO, logger=__name__):
+            noop()
+        with caplog.at_level(logging.DEBUG, logger=__name__):
+            noop()
+
+        assert len(caplog.messages) == 2
@@ -0,0 +1,387 @@
+"""
+Unit tests for memory optimization utilities.
+"""
+
+import gc
+import time
+from collections import deque
+from unittest.mock import Mock, patch
+
+import pytest
+
+from customer_snapshot.utils import memory_optimizer
+from customer_snapshot.utils.memory_optimizer import (
+    MemoryEfficientNLPProcessor,
+    MemoryMonitoringService,
+    MemoryOptimizer,
+    MemoryTracker,
+    StreamingVTTReader,
+    memory_limit,
+    memory_profile,
+)
+
+
+class TestMemoryTracker:
+    """Test cases for MemoryTracker."""
+
+    def test_current_metrics(self):
+        """Test that metrics report positive process memory."""
+        metrics = MemoryTracker().get_current_metrics()
+
+        assert metrics.rss_mb > 0
+        assert metrics.vms_mb >= metrics.rss_mb
+        assert 0 < metrics.percent <= 100
+        assert metrics.gc_objects > 0
+
+    def test_gc_objects_are_sampled(self):
+        """Test that the heap is only walked every Nth metrics call."""
+        tracker = MemoryTracker()
+        interval = MemoryTracker.GC_OBJECTS_SAMPLE_INTERVAL
+
+        with patch(
+            "customer_snapshot.utils.memory_optimizer.gc.get_objects",
+            return_value=[object()] * 3,
+        ) as get_objects:
+            counts = [
+                tracker.get_current_metrics().gc_objects for _ in range(interval + 1)
+            ]
+
+        assert get_objects.call_count == 2
+        assert counts == [3] * (interval + 1)
+
+    def test_snapshot_history_is_bounded(self):
+        """Test that only the newest max_snapshots snapshots are kept."""
+        tracker = MemoryTracker()
+        tracker.snapshots = deque(maxlen=3)
+
+        for i in range(5):
+            tracker.take_snapshot(f"step {i}")
+
+        assert [s["label"] for s in tracker.snapshots] == ["step 2", "step 3", "step 4"]
+        assert tracker.analyze_memory_usage()["snapshots_count"] == 3
+
+    def test_heavy_dependencies_are_not_module_globals(self):
+        """Test that psutil and pympler are imported on use, not at import."""
+        assert not hasattr(memory_optimizer, "psutil")
+        assert not hasattr(memory_optimizer, "tracker")
+
+    def test_pympler_tracker_is_built_on_first_access(self):
+        """Test that the pympler tracker is created lazily and then reused."""
+        with patch.object(memory_optimizer, "_load_pympler_tracker") as load:
+            tracker = MemoryTracker()
+            load.assert_not_called()
+
+            first = tracker.pympler_tracker
+            assert tracker.pympler_tracker is first
+
+        load.return_value.SummaryTracker.assert_called_once_with()
+
+    def test_print_memory_report_writes_once(self):
+        """Test that the report reaches stdout in a single write."""
+        tracker = MemoryTracker()
+        tracker.take_snapshot("start")
+        tracker.take_snapshot("end")
+
+        with patch.object(memory_optimizer.sys, "stdout") as stdout:
+            tracker.print_memory_report()
+
+        stdout.write.assert_called_once()
+        report = stdout.write.call_args.args[0]
+        assert report.startswith("\n" + "=" * 50 + "\n🧠 MEMORY USAGE ANALYSIS\n")
+        assert "📊 Snapshots analyzed: 2\n" in report
+        assert report.endswith("MEMORY USAGE\n")
+
+    def test_print_memory_report_without_snapshots(self, capsys):
+        """Test that an empty tracker reports the analysis error."""
+        MemoryTracker().print_memory_report()
+
+        assert capsys.readouterr().out.endswith(
+            "❌ Insufficient snapshots for analysis\n"
+        )
+
+
+class TestMemoryMonitoringService:
+    """Test cases for MemoryMonitoringService."""
+
+    def test_stop_interrupts_the_interval_wait(self, test_config):
+        """Test that stop() wakes the loop instead of waiting out the interval."""
+        service = MemoryMonitoringService(test_config, interval=60)
+        service.start()
+
+        start = time.monotonic()
+        service.stop()
+
+        assert time.monotonic() - start < 1
+        assert not service.thread.is_alive()
+
+    def test_service_can_be_restarted(self, test_config):
+        """Test that a stopped service takes snapshots again after start()."""
+        service = MemoryMonitoringService(test_config, interval=60)
+        service.start()
+        service.stop()
+        snapshots = len(service.tracker.snapshots)
+
+        service.start()
+        try:
+            deadline = time.monotonic() + 5
+            while len(service.tracker.snapshots) == snapshots:
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+        finally:
+            service.stop()
+
+        assert not service.thread.is_alive()
+
+
+class TestMemoryOptimizer:
+    """Test cases for MemoryOptimizer."""
+
+    def test_cached_operation_is_keyed_by_key(self, test_config):
+        """Test that a hit skips the operation even for a new callable."""
+        optimizer = MemoryOptimizer(test_config)
+        first, second = Mock(return_value=1), Mock(return_value=2)
+
+        assert optimizer.cached_operation("answer", first) == 1
+        assert optimizer.cached_operation("answer", second) == 1
+        first.assert_called_once()
+        second.assert_not_called()
+
+    def test_cached_operation_evicts_least_recently_used(self, test_config):
+        """Test that the cache is bounded and keeps recently used keys."""
+        optimizer = MemoryOptimizer(test_config)
+        size = MemoryOptimizer.OPERATION_CACHE_SIZE
+
+        for i in range(size):
+            optimizer.cached_operation(f"key{i}", lambda i=i: i)
+        optimizer.cached_operation("key0", Mock())  # refresh the oldest
+        optimizer.cached_operation("extra", lambda: "extra")
+
+        recompute = Mock(return_value="recomputed")
+        assert optimizer.cached_operation("key0", recompute) == 0
+        assert optimizer.cached_operation("key1", recompute) == "recomputed"
+
+    def test_caches_are_per_instance_and_clearable(self, test_config):
+        """Test that optimizers do not share results and can drop them."""
+        optimizer, other = MemoryOptimizer(test_config), MemoryOptimizer(test_config)
+        optimizer.cached_operation("key", lambda: "mine")
+
+        assert other.cached_operation("key", lambda: "theirs") == "theirs"
+
+        optimizer.clear_caches()
+        assert optimizer.cached_operation("key", lambda: "fresh") == "fresh"
+
+    def test_optimize_for_large_files_does_not_freeze_objects(self, test_config):
+        """Test that repeated calls leave the permanent generation alone."""
+        optimizer = MemoryOptimizer(test_config)
+        frozen = gc.get_freeze_count()
+
+        for _ in range(3):
+            optimizer.optimize_for_large_files()
+            garbage = [[] for _ in range(100)]  # noqa: F841
+
+        assert gc.get_freeze_count() == frozen
+
+    def test_stream_process_large_text_keeps_words_whole(self, test_config):
+        """Test that chunks are bounded, split at spaces and lossless."""
+        optimizer = MemoryOptimizer(test_config)
+        text = " ".join(f"word{i}" for i in range(500))
+
+        chunks = list(optimizer.stream_process_large_text(text, chunk_size=64))
+
+        assert "".join(chunks) == text
+        assert all(len(chunk) <= 64 for chunk in chunks)
+        words = set(text.split())
+        assert all(set(chunk.split()) <= words for chunk in chunks)
+
+    def test_stream_process_large_text_cuts_unbroken_text(self, test_config):
+        """Test that text without spaces is still cut at chunk_size."""
+        optimizer = MemoryOptimizer(test_config)
+
+        chunks = list(optimizer.stream_process_large_text("x" * 25, chunk_size=10))
+
+        assert chunks == ["x" * 10, "x" * 10, "x" * 5]
+
+    @pytest.mark.parametrize("growth_mb,collected", [(10, False), (80, True)])
+    def test_memory_monitoring_collects_only_on_growth(
+        self, test_config, growth_mb, collected
+    ):
+        """Test that a full collection only follows significant growth."""
+        optimizer = MemoryOptimizer(test_config)
+        optimizer.tracker = Mock()
+        optimizer.tracker.take_snapshot.side_effect = [
+            Mock(rss_mb=100.0),
+            Mock(rss_mb=100.0 + growth_mb),
+        ]
+
+        gc_collect = "customer_snapshot.utils.memory_optimizer.gc.collect"
+        with patch(gc_collect) as collect, optimizer.memory_monitoring("load"):
+            pass
+
+        assert collect.called is collected
+
+    def test_file_readers(self, test_config, temp_dir):
+        """Test the line reader and the fixed-size chunk reader."""
+        text_file = temp_dir / "notes.txt"
+        text_file.write_text("first line\nsecond line\nlast", encoding="utf-8")
+        optimizer = MemoryOptimizer(test_config)
+
+        lines = list(optimizer.get_memory_efficient_line_reader(str(text_file)))
+        chunks = list(optimizer.get_memory_efficient_reader(str(text_file), 10))
+
+        assert lines == ["first line\n", "second line\n", "last"]
+        assert "".join(chunks) == "first line\nsecond line\nlast"
+        assert [len(chunk) for chunk in chunks] == [10, 10, 7]
+
+    def test_mmap_reader_stays_open_inside_block(self, test_config, temp_dir):
+        """Test that the map is readable in the block and closed after it."""
+        data_file = temp_dir / "data.bin"
+        data_file.write_bytes(b"header\npayload")
+        optimizer = MemoryOptimizer(test_config)
+
+        with optimizer.get_mmap_reader(str(data_file)) as mm:
+            assert mm[:6] == b"header"
+            assert mm.find(b"payload") == 7
+
+        assert mm.closed
+
+    def test_mmap_reader_reports_missing_file(self, test_config, temp_dir, caplog):
+        """Test that mapping errors are logged and re-raised."""
+        optimizer = MemoryOptimizer(test_config)
+
+        missing = str(temp_dir / "missing.bin")
+        with pytest.raises(FileNotFoundError), optimizer.get_mmap_reader(missing):
+            pass
+
+        assert "Error memory-mapping file" in caplog.text
+
+
+class TestStreamingVTTReader:
+    """Test cases for StreamingVTTReader."""
+
+    def test_yields_every_cue(self, sample_vtt_file):
+        """Test that each cue is yielded with its timing and text."""
+        subtitles = list(StreamingVTTReader().read_streaming(sample_vtt_file))
+
+        assert len(subtitles) == 5
+        assert subtitles[0] == {
+            "timestamp": "00:00:01.000 --> 00:00:05.000",
+            "text": "Speaker 1: Welcome to the Quiznos Analytics "
+            "implementation meeting.",
+        }
+        assert subtitles[-1]["timestamp"] == "00:00:20.000 --> 00:00:25.000"
+
+    def test_joins_lines_and_skips_identifiers(self, temp_dir):
+        """Test multi-line cues, cue identifiers, CRLF and empty cues."""
+        vtt_file = temp_dir / "cues.vtt"
+        vtt_file.write_bytes(
+            b"WEBVTT\r\n\r\n"
+            b"intro\r\n00:01.000 --> 00:02.000 align:start\r\n"
+            b"  first line \r\nsecond line\r\n\r\n"
+            b"00:02.000 --> 00:03.000\r\n\r\n"
+            b"00:03.000 --> 00:04.000\r\nno trailing newline"
+        )
+
+        subtitles = list(StreamingVTTReader().read_streaming(vtt_file))
+
+        assert subtitles == [
+            {
+                "timestamp": "00:01.000 --> 00:02.000 align:start",
+                "text": "first line second line",
+            },
+            {"timestamp": "00:03.000 --> 00:04.000", "text": "no trailing newline"},
+        ]
+
+    def test_empty_file_yields_nothing(self, temp_dir):
+        """Test that an empty file is handled without mapping it."""
+        vtt_file = temp_dir / "empty.vtt"
+        vtt_file.write_bytes(b"")
+
+        assert list(StreamingVTTReader().read_streaming(vtt_file)) == []
+
+
+class TestMemoryEfficientNLPProcessor:
+    """Test cases for MemoryEfficientNLPProcessor."""
+
+    @pytest.fixture
+    def processor(self, test_config):
+        """Processor backed by a blank pipeline with a rule-based recognizer."""
+        spacy = pytest.importorskip("spacy")
+        nlp = spacy.blank("en")
+        nlp.add_pipe("entity_ruler").add_patterns(
+            [{"label": "ORG", "pattern": "Quiznos"}]
+        )
+
+        processor = MemoryEfficientNLPProcessor(test_config)
+        processor._nlp_model = nlp
+        return processor
+
+    def test_process_text_streaming(self, processor):
+        """Test that every chunk is returned with its entities."""
+        text = "Quiznos signed. " * 20
+
+        results = list(processor.process_text_streaming(text, chunk_size=50))
+
+        assert "".join(result["text"] for result in results) == text
+        assert all(result["length"] == len(result["text"]) for result in results)
+        assert sum(len(result["entities"]) for result in results) == 20
+        assert ("Quiznos", "ORG") in results[0]["entities"]
+
+    def test_extract_entities_batch(self, processor):
+        """Test that results keep each text paired with its own entities."""
+        texts = ["Quiznos is here", "nothing", "Quiznos again"]
+
+        batches = list(processor.extract_entities_batch(texts, batch_size=2))
+
+        assert [len(batch) for batch in batches] == [2, 1]
+        results = [result for batch in batches for result in batch]
+        assert [result["text"] for result in results] == texts
+        assert [len(result["entities"]) for result in results] == [1, 0, 1]
+
+
+class TestMemoryDecorators:
+    """Test cases for memory_limit and memory_profile."""
+
+    def test_memory_limit_reuses_shared_tracker(self):
+        """Test that limited calls do not build a tracker each time."""
+
+        @memory_limit(1024 * 1024)
+        def compute():
+            return 42
+
+        compute()
+        with patch.object(memory_optimizer, "MemoryTracker") as tracker_class:
+            assert compute() == 42
+
+        tracker_class.assert_not_called()
+
+    def test_memory_limit_raises_when_exceeded(self):
+        """Test that exceeding the limit raises MemoryError."""
+        tracker = Mock()
+        tracker.get_current_metrics.return_value = Mock(rss_mb=200.0)
+
+        @memory_limit(100, tracker=tracker)
+        def compute():
+            return 42
+
+        with pytest.raises(MemoryError, match="exceeded memory limit"):
+            compute()
+
+    @pytest.mark.parametrize("use_tracker", [False, True])
+    def test_memory_profile_forms(self, capsys, use_tracker):
+        """Test both the bare and the tracker= decorator forms."""
+        tracker = MemoryTracker() if use_tracker else None
+
+        def compute(value):
+            return value * 2
+
+        profiled = (
+            memory_profile(tracker=tracker)(compute)
+            if use_tracker
+            else memory_profile(compute)
+        )
+
+        assert profiled(21) == 42
+        assert profiled.__name__ == "compute"
+        assert "MEMORY USAGE ANALYSIS" in capsys.readouterr().out
+        if use_tracker:
+            assert len(tracker.snapshots) == 2